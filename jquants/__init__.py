@@ -6,6 +6,7 @@ __version__ = "0.0.0"
 from .client_v2 import ClientV2
 from .exceptions import (
     JQuantsAPIError,
+    JQuantsConfigWarning,
     JQuantsForbiddenError,
     JQuantsRateLimitError,
 )
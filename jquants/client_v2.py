@@ -3,6 +3,7 @@
 import json
 import os
 import platform
+import stat
 import sys
 import time
 import tomllib
@@ -10,6 +11,7 @@ import warnings
 from concurrent.futures import ThreadPoolExecutor
 from datetime import date as date_type
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, List, Optional, Union
 
@@ -21,17 +23,51 @@ from urllib3.util import Retry
 from jquants import __version__, constants_v2
 from jquants.exceptions import (
     JQuantsAPIError,
+    JQuantsConfigWarning,
     JQuantsForbiddenError,
     JQuantsRateLimitError,
 )
 from jquants.pacer import Pacer
 
 
+@lru_cache(maxsize=32)
+def _parse_toml_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Parse a TOML file, memoized by (absolute path, mtime_ns, size).
+
+    mtime_ns/size are part of the cache key only, so an edited file is
+    re-parsed automatically. Failures (I/O errors, TOML syntax errors) are
+    raised and not cached: a cached exception would keep its traceback, and
+    with it the raw file contents, alive.
+
+    Args:
+        path: Absolute path to TOML file
+        mtime_ns: File modification time (os.stat().st_mtime_ns)
+        size: File size in bytes (os.stat().st_size)
+
+    Returns:
+        dict: Parsed document. Shared; callers must not mutate it.
+
+    Raises:
+        OSError: File cannot be read
+        tomllib.TOMLDecodeError: Invalid TOML syntax
+    """
+    # Read the whole file in one call, then parse from memory
+    with open(path, mode="rb") as f:
+        data = f.read()
+    return tomllib.loads(data.decode("utf-8"))
+
+
+# Zero-row prototypes keyed by (columns, date_columns); see ClientV2._empty_dataframe
+_EMPTY_DF_CACHE: dict[tuple[tuple[str, ...], tuple[str, ...]], pd.DataFrame] = {}
+
+
 class ClientV2:
     """J-Quants API V2 Client using API key authentication."""
 
     JQUANTS_API_BASE = "https://api.jquants.com/v2"
     MAX_WORKERS = 5
+    DEFAULT_RATE_LIMIT = 5  # req/min (Free plan)
     USER_AGENT = "jqapi-python"
     RAW_ENCODING = "utf-8"
     REQUEST_TIMEOUT = 30  # seconds
@@ -48,6 +84,7 @@ class ClientV2:
         retry_on_429: bool = True,
         retry_wait_seconds: int = 310,
         retry_max_attempts: int = 3,
+        burst: int = 1,
     ) -> None:
         """
         Initialize ClientV2 with API key authentication.
@@ -59,28 +96,29 @@ class ClientV2:
             retry_on_429: 429時リトライするか
             retry_wait_seconds: 429時の待機時間（秒）
             retry_max_attempts: 最大リトライ回数
+            burst: 待機なしで連続発行できる最大リクエスト数, 1=バーストなし
 
         Raises:
             ValueError: api_keyが未設定または空文字の場合
-            ValueError: rate_limit/max_workers/retry_wait_seconds <= 0 の場合
+            ValueError: rate_limit/max_workers/retry_wait_seconds/burst <= 0 の場合
             ValueError: retry_max_attempts < 0 の場合
             TypeError: api_keyが文字列以外の場合
         """
-        config = self._load_config()
-
-        # Get api_key from config or argument
-        self._api_key = config.get("api_key", "")
+        config = self._load_config(skip_implicit=api_key is not None)
 
+        # Get api_key from argument, falling back to config
         if api_key is not None:
             if not isinstance(api_key, str):
                 raise TypeError(
                     f"api_key must be a string, got {type(api_key).__name__}"
                 )
-            self._api_key = api_key
+            raw_api_key = api_key
+        else:
+            # _read_config drops/raises on non-string values; env is always str
+            raw_api_key = config.get("api_key", "")
 
-        # Strip whitespace and newlines from all sources
-        if isinstance(self._api_key, str):
-            self._api_key = self._api_key.strip()
+        # Strip whitespace and newlines once, on the chosen source only
+        self._api_key: str = raw_api_key.strip()
 
         if not self._api_key:
             raise ValueError(
@@ -89,7 +127,9 @@ class ClientV2:
             )
 
         # Validate and set rate limit parameters
-        effective_rate_limit = rate_limit if rate_limit is not None else 5
+        effective_rate_limit = (
+            rate_limit if rate_limit is not None else self.DEFAULT_RATE_LIMIT
+        )
         if effective_rate_limit <= 0:
             raise ValueError(f"rate_limit must be positive, got {effective_rate_limit}")
         self._rate_limit = effective_rate_limit
@@ -112,11 +152,23 @@ class ClientV2:
 
         self._retry_on_429 = retry_on_429
 
+        if burst <= 0:
+            raise ValueError(f"burst must be positive, got {burst}")
+        self._burst = burst
+
         # Initialize Pacer for rate limiting
-        self._pacer = Pacer(rate=self._rate_limit)
+        self._pacer = Pacer(rate=self._rate_limit, burst=self._burst)
 
         self._session: Optional[requests.Session] = None
 
+        # Request headers are fixed for the client's lifetime; build them once
+        self._headers: dict[str, str] = {
+            "x-api-key": self._api_key,
+            "User-Agent": (
+                f"{self.USER_AGENT}/{__version__}/v2 p/{platform.python_version()}"
+            ),
+        }
+
     def _is_colab(self) -> bool:
         """Return True if running in Google Colab."""
         return "google.colab" in sys.modules
@@ -135,13 +187,19 @@ class ClientV2:
             dict: Config section or empty dict if not found/invalid
         """
         try:
-            if not os.path.isfile(config_path):
+            # Single stat: existence check (same semantics as os.path.isfile)
+            # and cache key for the parsed document
+            try:
+                st: os.stat_result | None = os.stat(config_path)
+            except (OSError, ValueError):
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
                 if explicit:
                     raise FileNotFoundError(f"Config file not found: {config_path}")
                 return {}
 
-            with open(config_path, mode="rb") as f:
-                ret = tomllib.load(f)
+            abs_path = os.path.abspath(config_path)
+            ret = _parse_toml_cached(abs_path, st.st_mtime_ns, st.st_size)
 
         except FileNotFoundError:
             if explicit:
@@ -152,7 +210,7 @@ class ClientV2:
                 raise
             warnings.warn(
                 f"Failed to read config file '{config_path}': {e}. Ignoring this file.",
-                UserWarning,
+                JQuantsConfigWarning,
                 stacklevel=3,
             )
             return {}
@@ -160,7 +218,8 @@ class ClientV2:
         if "jquants-api-client" not in ret:
             return {}
 
-        section: dict[str, Any] = ret["jquants-api-client"]
+        # Copy: the parsed document is shared through the parse cache
+        section: dict[str, Any] = dict(ret["jquants-api-client"])
         if "api_key" in section:
             if not isinstance(section["api_key"], str):
                 if explicit:
@@ -172,59 +231,74 @@ class ClientV2:
                 warnings.warn(
                     f"api_key in config file '{config_path}' must be a string, "
                     f"got {type(section['api_key']).__name__}. Ignoring this value.",
-                    UserWarning,
+                    JQuantsConfigWarning,
                     stacklevel=3,
                 )
                 del section["api_key"]
         return section
 
-    def _load_config(self) -> dict[str, Any]:
+    def _load_config(self, *, skip_implicit: bool = False) -> dict[str, Any]:
         """
         Load configuration from multiple sources with priority.
 
         Priority (later wins): Colab -> user -> cwd -> env_file -> env
 
+        Implicit files (Colab/user/cwd) can only contribute api_key, which
+        JQUANTS_API_KEY always overrides, so they are not read at all when
+        that variable is set. The explicit env_file is always read so that a
+        wrong JQUANTS_API_CLIENT_CONFIG_FILE still fails fast.
+
+        Args:
+            skip_implicit: If True, skip implicit files (caller already has
+                a higher-priority api_key, e.g. the api_key argument)
+
         Returns:
             dict: Merged configuration
         """
         config: dict[str, Any] = {}
 
-        # 1. Colab config (implicit)
-        if self._is_colab():
-            colab_path = "/content/drive/MyDrive/drive_ws/secret/jquants-api.toml"
-            config = {**config, **self._read_config(colab_path, explicit=False)}
+        # Each environment variable is looked up exactly once
+        env_path = os.environ.get("JQUANTS_API_CLIENT_CONFIG_FILE")
+        env_key = os.environ.get("JQUANTS_API_KEY")
+
+        if not skip_implicit and env_key is None:
+            # 1. Colab config (implicit)
+            if self._is_colab():
+                colab_path = "/content/drive/MyDrive/drive_ws/secret/jquants-api.toml"
+                config = {**config, **self._read_config(colab_path, explicit=False)}
 
-        # 2. User default config (implicit)
-        user_path = f"{Path.home()}/.jquants-api/jquants-api.toml"
-        config = {**config, **self._read_config(user_path, explicit=False)}
+            # 2. User default config (implicit)
+            user_path = f"{Path.home()}/.jquants-api/jquants-api.toml"
+            config = {**config, **self._read_config(user_path, explicit=False)}
 
-        # 3. Current dir config (implicit)
-        config = {**config, **self._read_config("jquants-api.toml", explicit=False)}
+            # 3. Current dir config (implicit)
+            config = {
+                **config,
+                **self._read_config("jquants-api.toml", explicit=False),
+            }
 
         # 4. Env specified config (explicit - fail-fast on error)
-        if "JQUANTS_API_CLIENT_CONFIG_FILE" in os.environ:
-            env_path = os.environ["JQUANTS_API_CLIENT_CONFIG_FILE"]
+        if env_path is not None:
             config = {**config, **self._read_config(env_path, explicit=True)}
 
         # 5. Environment variable (overrides lower priority sources, even if empty)
-        if "JQUANTS_API_KEY" in os.environ:
-            config["api_key"] = os.environ["JQUANTS_API_KEY"]
+        if env_key is not None:
+            config["api_key"] = env_key
 
         return config
 
     def _base_headers(self) -> dict[str, str]:
         """
-        Generate base headers for API requests.
+        Return base headers for API requests.
 
         Returns:
             dict: Headers including x-api-key and User-Agent
+
+        Note:
+            The dict is built once in __init__ and shared across requests;
+            callers must not mutate it.
         """
-        return {
-            "x-api-key": self._api_key,
-            "User-Agent": (
-                f"{self.USER_AGENT}/{__version__}/v2 p/{platform.python_version()}"
-            ),
-        }
+        return self._headers
 
     def _request_session(self) -> requests.Session:
         """
@@ -633,6 +707,62 @@ class ClientV2:
 
         return all_data
 
+    @staticmethod
+    def _empty_dataframe(
+        columns: list[str],
+        date_columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Build an empty DataFrame with the expected columns and dtypes.
+
+        Date columns are created as datetime64 directly in the constructor,
+        so no per-column pd.to_datetime pass is needed afterwards. Only the
+        dtype kind is guaranteed: the resolution of non-empty frames follows
+        pd.to_datetime and the input (e.g. [us] or [ns] on pandas 3.x). The
+        frame is built once per (columns, date_columns) and a copy of the
+        cached prototype is returned on later calls.
+
+        Args:
+            columns: Column order
+            date_columns: Columns to create with a datetime64 dtype
+
+        Returns:
+            Empty pandas DataFrame (a fresh copy; safe to mutate)
+        """
+        key = (tuple(columns), tuple(date_columns) if date_columns else ())
+        prototype = _EMPTY_DF_CACHE.get(key)
+        if prototype is None:
+            date_set = set(key[1])
+            prototype = pd.DataFrame(
+                {
+                    col: pd.Series(
+                        dtype="datetime64[ns]" if col in date_set else object
+                    )
+                    for col in columns
+                }
+            )
+            _EMPTY_DF_CACHE[key] = prototype
+        return prototype.copy()
+
+    @staticmethod
+    def _is_sorted(df: pd.DataFrame, columns: list[str]) -> bool:
+        """
+        Return True if df is already in ascending lexicographic order of columns.
+
+        Rows with NaN/NaT in a key column are reported as unsorted, so such
+        frames still go through sort_values (NaN last).
+
+        Args:
+            df: DataFrame to check
+            columns: Sort key columns (must exist in df)
+
+        Returns:
+            bool: True if sort_values(columns) would not change the row order
+        """
+        if len(columns) == 1:
+            return bool(df[columns[0]].is_monotonic_increasing)
+        return bool(pd.MultiIndex.from_frame(df[columns]).is_monotonic_increasing)
+
     def _to_dataframe(
         self,
         data: list[dict[str, Any]],
@@ -669,24 +799,22 @@ class ClientV2:
         """
         if not data:
             # Return empty DataFrame with expected columns and proper dtypes
-            df = pd.DataFrame(columns=columns)
-            # Ensure date columns have datetime dtype even when empty
-            if date_columns:
-                for col in date_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col])
-            return df
-
-        df = pd.DataFrame(data)
+            # Strict and coercing date columns are both datetime64 when non-empty
+            empty_date_columns = (date_columns or []) + (date_coerce_columns or [])
+            return self._empty_dataframe(columns, empty_date_columns)
 
-        # Add missing columns and reorder in one operation
+        # Select and order columns while building the frame (no reindex pass)
         if ensure_all_columns:
-            # Use reindex to add missing columns as NaN and reorder
-            df = df.reindex(columns=columns)
+            # Missing columns are created as NaN
+            selected_columns = columns
         else:
-            # Reorder columns (only include existing columns)
-            existing_columns = [c for c in columns if c in df.columns]
-            df = df[existing_columns]
+            # Only include columns present in at least one record
+            present = set().union(*data)
+            selected_columns = [c for c in columns if c in present]
+        # Explicit index keeps the row count when no expected column is present
+        df = pd.DataFrame.from_records(
+            data, columns=selected_columns, index=range(len(data))
+        )
 
         # Convert date columns (empty string/None/invalid -> NaT)
         if date_columns:
@@ -695,7 +823,8 @@ class ClientV2:
                     # Replace empty strings with None first for proper NaT conversion
                     df[col] = df[col].replace("", None)
                     # Use errors="coerce" to handle unexpected formats like "0000-00-00"
-                    df[col] = pd.to_datetime(df[col], errors="coerce")
+                    # Explicit ISO8601 format skips per-call format inference
+                    df[col] = pd.to_datetime(df[col], format="ISO8601", errors="coerce")
 
         # Convert date columns with empty string tolerance
         # Empty strings -> NaT, other invalid values -> raise
@@ -705,7 +834,7 @@ class ClientV2:
                     # Replace empty strings with None first
                     df[col] = df[col].replace("", None)
                     # Then strict conversion (None -> NaT, invalid -> raise)
-                    df[col] = pd.to_datetime(df[col])
+                    df[col] = pd.to_datetime(df[col], format="ISO8601")
 
         # Convert numeric columns (empty string -> NaN)
         if numeric_columns:
@@ -716,7 +845,8 @@ class ClientV2:
         # Sort
         if sort_columns:
             sort_cols_existing = [c for c in sort_columns if c in df.columns]
-            if sort_cols_existing:
+            # API responses are often already ordered; skip the sort then
+            if sort_cols_existing and not self._is_sorted(df, sort_cols_existing):
                 df = df.sort_values(sort_cols_existing).reset_index(drop=True)
 
         return df
@@ -1208,7 +1338,7 @@ class ClientV2:
         # Convert date columns
         for col in ["PubDate", "AppDate"]:
             if col in df.columns:
-                df[col] = pd.to_datetime(df[col])
+                df[col] = pd.to_datetime(df[col], format="ISO8601")
 
         # Sort
         sort_cols = [c for c in ["PubDate", "Code"] if c in df.columns]
@@ -1246,19 +1376,26 @@ class ClientV2:
                     f"Invalid date format '{dt}'. Expected YYYY-MM-DD (e.g., '2024-01-05')"
                 )
 
-    def _generate_date_range(self, start: str, end: str) -> list[str]:
-        """Generate list of YYYY-MM-DD strings from start to end (inclusive)."""
-        from datetime import timedelta
+    def _generate_date_range(
+        self, start: str, end: str, *, business_days_only: bool = False
+    ) -> list[str]:
+        """Generate list of YYYY-MM-DD strings from start to end (inclusive).
+
+        Args:
+            start: 開始日 YYYY-MM-DD
+            end: 終了日 YYYY-MM-DD
+            business_days_only: True時、土日を除外する（祝日は除外しない）
 
+        Returns:
+            list[str]: YYYY-MM-DD 文字列のリスト
+        """
         start_date = datetime.strptime(start, "%Y-%m-%d").date()
         end_date = datetime.strptime(end, "%Y-%m-%d").date()
 
-        dates = []
-        current = start_date
-        while current <= end_date:
-            dates.append(current.isoformat())
-            current += timedelta(days=1)
-
+        freq = "B" if business_days_only else "D"
+        dates: list[str] = (
+            pd.date_range(start_date, end_date, freq=freq).strftime("%Y-%m-%d").tolist()
+        )
         return dates
 
     def _fetch_date_range(
@@ -1270,6 +1407,7 @@ class ClientV2:
         empty_columns: List[str],
         date_columns: Optional[List[str]] = None,
         ensure_all_columns: bool = False,
+        business_days_only: bool = False,
     ) -> pd.DataFrame:
         """
         日付範囲でデータを取得する共通ロジック.
@@ -1284,6 +1422,7 @@ class ClientV2:
             empty_columns: 空DataFrame時のカラム定義
             date_columns: datetime64変換対象カラム（空結果時の型保証用）
             ensure_all_columns: True時、カラム補完・順序保証を行う
+            business_days_only: True時、土日の取得をスキップする
 
         Returns:
             pd.DataFrame: 結合・ソート済みのDataFrame
@@ -1306,11 +1445,13 @@ class ClientV2:
             )
 
         # Generate date range (dates are already validated by _normalize_date)
-        dates = self._generate_date_range(start_str, end_str)
+        dates = self._generate_date_range(
+            start_str, end_str, business_days_only=business_days_only
+        )
 
         # Fetch data
-        if self._max_workers == 1:
-            # Sequential execution
+        if self._max_workers == 1 or len(dates) == 1:
+            # Sequential execution (single day: no executor overhead)
             dfs = [fetch_func(d) for d in dates]
         else:
             # Parallel execution with ThreadPoolExecutor
@@ -1321,26 +1462,24 @@ class ClientV2:
         non_empty_dfs = [df for df in dfs if not df.empty]
         if not non_empty_dfs:
             # Return empty DataFrame with expected columns and proper dtypes
-            df = pd.DataFrame(columns=empty_columns)
-            if date_columns:
-                for col in date_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_datetime(df[col])
-            return df
+            return self._empty_dataframe(empty_columns, date_columns)
 
-        result = pd.concat(non_empty_dfs, ignore_index=True)
+        # Single concat over the collected frames (never concat inside the loop).
+        # A single frame (e.g. start_dt == end_dt) needs no concat at all.
+        if len(non_empty_dfs) == 1:
+            result = non_empty_dfs[0].reset_index(drop=True)
+        else:
+            result = pd.concat(non_empty_dfs, ignore_index=True)
 
-        # Ensure all columns are present and in correct order
+        # Ensure all columns are present and in correct order (one reindex
+        # instead of inserting missing columns one by one)
         if ensure_all_columns:
-            for col in empty_columns:
-                if col not in result.columns:
-                    result[col] = pd.NA
-            result = result[empty_columns]
+            result = result.reindex(columns=empty_columns, fill_value=pd.NA)
 
-        # Sort by specified columns (skip non-existent columns)
+        # Sort once at the end; ignore_index avoids a separate reset_index copy
         sort_cols = [c for c in sort_columns if c in result.columns]
-        if sort_cols:
-            result = result.sort_values(sort_cols).reset_index(drop=True)
+        if sort_cols and not self._is_sorted(result, sort_cols):
+            result = result.sort_values(sort_cols, ignore_index=True)
 
         return result
 
@@ -1486,6 +1625,8 @@ class ClientV2:
         self,
         start_dt: Union[str, datetime, date_type],
         end_dt: Optional[Union[str, datetime, date_type]] = None,
+        *,
+        business_days_only: bool = False,
     ) -> pd.DataFrame:
         """
         日付範囲で決算短信サマリーを取得する.
@@ -1493,6 +1634,7 @@ class ClientV2:
         Args:
             start_dt: 開始日（YYYY-MM-DD文字列, date, または datetime）
             end_dt: 終了日（YYYY-MM-DD文字列, date, または datetime。省略時: 今日）
+            business_days_only: True時、土日の取得をスキップしAPI呼び出しを削減する
 
         Returns:
             pd.DataFrame: 決算短信サマリー（DiscDate, DiscTime, Code昇順でソート）
@@ -1514,6 +1656,7 @@ class ClientV2:
             empty_columns=constants_v2.FINS_SUMMARY_COLUMNS,
             date_columns=constants_v2.FINS_SUMMARY_DATE_COLUMNS,
             ensure_all_columns=True,
+            business_days_only=business_days_only,
         )
 
     # =========================================================================
@@ -1585,5 +1728,5 @@ class ClientV2:
             fetch_func=lambda d: self.get_options_225_daily(date=d),
             sort_columns=["Code", "Date"],
             empty_columns=constants_v2.DERIVATIVES_OPTIONS_225_COLUMNS,
-            date_columns=["Date"],
+            date_columns=constants_v2.DERIVATIVES_OPTIONS_225_DATE_COLUMNS,
         )
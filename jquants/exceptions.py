@@ -49,3 +49,16 @@ class JQuantsRateLimitError(JQuantsAPIError):
     """
 
     pass
+
+
+class JQuantsConfigWarning(UserWarning):
+    """Problem in an implicit config file that was ignored.
+
+    Emitted when an implicit jquants-api.toml cannot be read or parsed, or
+    contains an invalid value. Every ``ClientV2()`` construction that hits
+    the problem warns; deduplication is left to the ``warnings`` filters,
+    e.g. ``warnings.simplefilter("once", JQuantsConfigWarning)``, and
+    ``warnings.simplefilter("ignore", JQuantsConfigWarning)`` silences it.
+    """
+
+    pass
@@ -2,35 +2,58 @@
 
 import threading
 import time
+from typing import Callable
 
 
 class Pacer:
     """Leaky Bucket方式のレートリミッター.
 
-    一定間隔でリクエストを整流化し、バーストを一切許容しない。
+    一定間隔でリクエストを整流化する。デフォルト (burst=1) ではバーストを
+    一切許容しない。burst > 1 の場合はトークンバケットとして振る舞い、
+    アイドル後は最大 burst 件まで即時発行し、以降は interval 間隔に戻る
+    （平均レートは rate のまま）。
     """
 
-    def __init__(self, rate: int) -> None:
+    def __init__(
+        self,
+        rate: int,
+        burst: int = 1,
+        *,
+        clock: Callable[[], int] = time.monotonic_ns,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
         """Initialize Pacer.
 
         Args:
             rate: 1分あたりの最大リクエスト数 (req/min)
+            burst: 待機なしで連続発行できる最大リクエスト数, 1=バーストなし
+            clock: 単調増加する現在時刻（ナノ秒, int）を返す関数（テスト用）
+            sleep: 指定秒数だけ待機する関数（テスト用）
 
         Raises:
-            ValueError: rate <= 0 の場合
+            ValueError: rate <= 0 または burst <= 0 の場合
         """
         if rate <= 0:
             raise ValueError(f"rate must be positive, got {rate}")
+        if burst <= 0:
+            raise ValueError(f"burst must be positive, got {burst}")
 
         self._rate = rate
-        self._interval = 60.0 / rate
-        self._last_request_time: float | None = None
+        # 時刻はすべて整数ナノ秒で扱う（浮動小数点の丸め誤差を蓄積させない）。
+        # 割り切れない場合は切り上げ、rate を超えないようにする
+        self._interval_ns = -(-60_000_000_000 // rate)
+        # バケット容量のうち、即時発行に使える前借り分（ナノ秒）
+        self._burst_window_ns = (burst - 1) * self._interval_ns
+        # 次のリクエストを発行できる最早時刻（None は未発行 = 即時発行可）
+        self._next_ns: int | None = None
         self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
 
     @property
     def interval(self) -> float:
         """リクエスト間隔（秒）."""
-        return self._interval
+        return self._interval_ns / 1e9
 
     def wait(self) -> float:
         """次のリクエストまで待機する.
@@ -41,29 +64,28 @@ class Pacer:
         Note:
             - 初回は即時（待機時間=0）
             - スレッドセーフであること
+            - ロック内では発行枠（スロット）の予約のみ行い、待機はロック外で行う。
+              並行する呼び出しは予約順に interval 間隔のスロットを得る
+            - burst > 1 の場合、アイドル後の最初の burst 件は即時に発行される
         """
         with self._lock:
-            now = time.monotonic()
-
-            # 初回は即時発行
-            if self._last_request_time is None:
-                self._last_request_time = now
-                return 0.0
-
-            # 前回リクエストからの経過時間
-            elapsed = now - self._last_request_time
-            wait_time = self._interval - elapsed
-
-            if wait_time > 0:
-                time.sleep(wait_time)
-                self._last_request_time = time.monotonic()
-                return wait_time
-            else:
-                # 間隔以上経過している場合は即時
-                self._last_request_time = now
-                return 0.0
+            now = self._clock()
+            # 初回・リセット後・間隔以上経過している場合は now が基準
+            due = now if self._next_ns is None else max(self._next_ns, now)
+            # バケットに残りがあれば burst_window の範囲で前倒しして発行する
+            slot = max(due - self._burst_window_ns, now)
+            self._next_ns = due + self._interval_ns
+
+        if slot > now:
+            wait_time = (slot - now) / 1e9
+            self._sleep(wait_time)
+            return wait_time
+        return 0.0
 
     def reset(self) -> None:
-        """状態をリセットする（テスト用）."""
-        with self._lock:
-            self._last_request_time = None
+        """状態をリセットする（テスト用）.
+
+        単一属性への代入はアトミックなためロックは取らない。wait() と並行して
+        呼ぶことは想定しない（テスト間の初期化用）。
+        """
+        self._next_ns = None
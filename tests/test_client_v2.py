@@ -3,7 +3,7 @@
 import os
 import platform
 import sys
-import tempfile
+import tomllib
 import warnings
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -37,30 +37,17 @@ class TestClientV2Instantiation:
             client = ClientV2()
             assert client._api_key == "env_api_key"
 
-    def test_instantiation_with_toml_config(self):
+    def test_instantiation_with_toml_config(self, tmp_path, monkeypatch):
         """ClientV2() with TOML config should create instance."""
         from jquants import ClientV2
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "jquants-api.toml"
-            config_path.write_text('[jquants-api-client]\napi_key = "toml_api_key"\n')
-            # Clear env vars and patch cwd
-            with patch.dict(os.environ, {}, clear=True):
-                with patch("os.path.isfile") as mock_isfile:
-                    with patch("builtins.open", create=True) as mock_open:
-                        # Mock file reading
-                        mock_isfile.side_effect = lambda p: p == "jquants-api.toml"
-                        mock_open.return_value.__enter__.return_value.read.return_value = (
-                            b'[jquants-api-client]\napi_key = "toml_api_key"\n'
-                        )
-                        # Use simpler approach: patch _load_config
-                        with patch.object(
-                            ClientV2,
-                            "_load_config",
-                            return_value={"api_key": "toml_api_key"},
-                        ):
-                            client = ClientV2()
-                            assert client._api_key == "toml_api_key"
+        config_path = tmp_path / "jquants-api.toml"
+        config_path.write_text('[jquants-api-client]\napi_key = "toml_api_key"\n')
+        # Clear env vars and read ./jquants-api.toml from tmp_path
+        monkeypatch.chdir(tmp_path)
+        with patch.dict(os.environ, {"HOME": str(tmp_path)}, clear=True):
+            client = ClientV2()
+            assert client._api_key == "toml_api_key"
 
     def test_instantiation_without_config_raises_valueerror(self):
         """ClientV2() without any config should raise ValueError."""
@@ -173,33 +160,30 @@ class TestClientV2Priority:
                 client = ClientV2()
                 assert client._api_key == "cwd_key"
 
-    def test_env_file_overrides_cwd_toml(self):
+    def test_env_file_overrides_cwd_toml(self, tmp_path):
         """JQUANTS_API_CLIENT_CONFIG_FILE should override cwd TOML."""
         from jquants import ClientV2
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write('[jquants-api-client]\napi_key = "explicit_key"\n')
-            explicit_path = f.name
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('[jquants-api-client]\napi_key = "explicit_key"\n')
+        explicit_path = str(config_path)
 
-        try:
-            with patch.dict(
-                os.environ,
-                {"JQUANTS_API_CLIENT_CONFIG_FILE": explicit_path},
-                clear=True,
-            ):
-                # Mock cwd toml to return different key
-                original_read_config = ClientV2._read_config
+        with patch.dict(
+            os.environ,
+            {"JQUANTS_API_CLIENT_CONFIG_FILE": explicit_path},
+            clear=True,
+        ):
+            # Mock cwd toml to return different key
+            original_read_config = ClientV2._read_config
 
-                def mock_read_config(self, path, *, explicit=False):
-                    if path == "jquants-api.toml":
-                        return {"api_key": "cwd_key"}
-                    return original_read_config(self, path, explicit=explicit)
+            def mock_read_config(self, path, *, explicit=False):
+                if path == "jquants-api.toml":
+                    return {"api_key": "cwd_key"}
+                return original_read_config(self, path, explicit=explicit)
 
-                with patch.object(ClientV2, "_read_config", mock_read_config):
-                    client = ClientV2()
-                    assert client._api_key == "explicit_key"
-        finally:
-            os.unlink(explicit_path)
+            with patch.object(ClientV2, "_read_config", mock_read_config):
+                client = ClientV2()
+                assert client._api_key == "explicit_key"
 
     def test_env_empty_string_overrides_toml(self):
         """Empty JQUANTS_API_KEY should override TOML config and cause ValueError."""
@@ -214,6 +198,41 @@ class TestClientV2Priority:
                     ClientV2()
                 assert "api_key is required" in str(exc_info.value)
 
+    def test_env_variable_skips_implicit_toml(self):
+        """JQUANTS_API_KEY set: implicit TOML files should not be read."""
+        from jquants import ClientV2
+
+        with patch.dict(os.environ, {"JQUANTS_API_KEY": "env_key"}, clear=True):
+            with patch.object(ClientV2, "_read_config", return_value={}) as mock_read:
+                client = ClientV2()
+                assert client._api_key == "env_key"
+                mock_read.assert_not_called()
+
+    def test_argument_skips_implicit_toml(self):
+        """api_key argument: implicit TOML files should not be read."""
+        from jquants import ClientV2
+
+        with patch.dict(os.environ, {}, clear=True):
+            with patch.object(ClientV2, "_read_config", return_value={}) as mock_read:
+                client = ClientV2(api_key="arg_key")
+                assert client._api_key == "arg_key"
+                mock_read.assert_not_called()
+
+    def test_env_variable_still_validates_explicit_file(self):
+        """JQUANTS_API_KEY set: explicit config path must still exist."""
+        from jquants import ClientV2
+
+        with patch.dict(
+            os.environ,
+            {
+                "JQUANTS_API_KEY": "env_key",
+                "JQUANTS_API_CLIENT_CONFIG_FILE": "/nonexistent/path.toml",
+            },
+            clear=True,
+        ):
+            with pytest.raises(FileNotFoundError):
+                ClientV2()
+
 
 class TestClientV2TOMLImplicit:
     """Test TOML reading in implicit mode (warnings, not errors)."""
@@ -230,134 +249,118 @@ class TestClientV2TOMLImplicit:
                 client = ClientV2()
                 assert client._api_key == "fallback_key"
 
-    def test_invalid_toml_format_warns_and_ignores(self):
+    def test_invalid_toml_format_warns_and_ignores(self, tmp_path):
         """Invalid TOML format should warn and continue."""
         from jquants import ClientV2
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write("invalid toml {{{")
-            invalid_path = f.name
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("invalid toml {{{")
+        invalid_path = str(config_path)
 
-        try:
-            client = ClientV2.__new__(ClientV2)
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                result = client._read_config(invalid_path, explicit=False)
+        client = ClientV2.__new__(ClientV2)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = client._read_config(invalid_path, explicit=False)
 
-                # Should return empty dict
-                assert result == {}
-                # Should have warned
-                assert len(w) == 1
-                assert "Failed to read config file" in str(w[0].message)
-                assert invalid_path in str(w[0].message)
-        finally:
-            os.unlink(invalid_path)
+            # Should return empty dict
+            assert result == {}
+            # Should have warned
+            assert len(w) == 1
+            assert "Failed to read config file" in str(w[0].message)
+            assert invalid_path in str(w[0].message)
 
-    def test_permission_error_warns_and_ignores(self):
+    def test_permission_error_warns_and_ignores(self, tmp_path):
         """Permission error should warn and continue."""
         from jquants import ClientV2
 
+        path = str(tmp_path / "jquants-api.toml")
+        Path(path).write_text('[jquants-api-client]\napi_key = "key"\n')
+
         client = ClientV2.__new__(ClientV2)
         with patch("builtins.open", side_effect=PermissionError("denied")):
-            with patch("os.path.isfile", return_value=True):
-                with warnings.catch_warnings(record=True) as w:
-                    warnings.simplefilter("always")
-                    result = client._read_config("/some/path.toml", explicit=False)
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                result = client._read_config(path, explicit=False)
 
-                    assert result == {}
-                    assert len(w) == 1
-                    assert "Failed to read config file" in str(w[0].message)
+                assert result == {}
+                assert len(w) == 1
+                assert "Failed to read config file" in str(w[0].message)
 
-    def test_missing_section_is_ignored(self):
+    def test_missing_section_is_ignored(self, tmp_path):
         """Missing [jquants-api-client] section should return empty dict."""
         from jquants import ClientV2
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write('[other-section]\nkey = "value"\n')
-            path = f.name
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('[other-section]\nkey = "value"\n')
+        path = str(config_path)
 
-        try:
-            client = ClientV2.__new__(ClientV2)
-            result = client._read_config(path, explicit=False)
-            assert result == {}
-        finally:
-            os.unlink(path)
+        client = ClientV2.__new__(ClientV2)
+        result = client._read_config(path, explicit=False)
+        assert result == {}
 
-    def test_missing_api_key_is_ignored(self):
+    def test_missing_api_key_is_ignored(self, tmp_path):
         """Missing api_key in section should return section without api_key."""
         from jquants import ClientV2
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write('[jquants-api-client]\nother_key = "value"\n')
-            path = f.name
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('[jquants-api-client]\nother_key = "value"\n')
+        path = str(config_path)
 
-        try:
-            client = ClientV2.__new__(ClientV2)
-            result = client._read_config(path, explicit=False)
-            # Section exists but no api_key
-            assert "api_key" not in result
-        finally:
-            os.unlink(path)
+        client = ClientV2.__new__(ClientV2)
+        result = client._read_config(path, explicit=False)
+        # Section exists but no api_key
+        assert "api_key" not in result
 
-    def test_api_key_not_string_implicit_warns_and_ignores(self):
+    def test_api_key_not_string_implicit_warns_and_ignores(self, tmp_path):
         """api_key in implicit TOML that is not string should warn and ignore."""
         from jquants import ClientV2
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write("[jquants-api-client]\napi_key = 12345\n")
-            path = f.name
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("[jquants-api-client]\napi_key = 12345\n")
+        path = str(config_path)
 
-        try:
-            client = ClientV2.__new__(ClientV2)
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                result = client._read_config(path, explicit=False)
+        client = ClientV2.__new__(ClientV2)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = client._read_config(path, explicit=False)
 
-                # Should return section without api_key (ignored)
-                assert "api_key" not in result
-                # Should have warned
-                assert len(w) == 1
-                assert "api_key in config file" in str(w[0].message)
-                assert "must be a string" in str(w[0].message)
-        finally:
-            os.unlink(path)
+            # Should return section without api_key (ignored)
+            assert "api_key" not in result
+            # Should have warned
+            assert len(w) == 1
+            assert "api_key in config file" in str(w[0].message)
+            assert "must be a string" in str(w[0].message)
 
-    def test_api_key_not_string_explicit_raises_typeerror(self):
+    def test_api_key_not_string_explicit_raises_typeerror(self, tmp_path):
         """api_key in explicit TOML that is not string should raise TypeError."""
         from jquants import ClientV2
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write("[jquants-api-client]\napi_key = 12345\n")
-            path = f.name
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("[jquants-api-client]\napi_key = 12345\n")
+        path = str(config_path)
 
-        try:
-            client = ClientV2.__new__(ClientV2)
-            with pytest.raises(TypeError) as exc_info:
-                client._read_config(path, explicit=True)
-            assert "api_key in config file" in str(exc_info.value)
-            assert "must be a string" in str(exc_info.value)
-            assert path in str(exc_info.value)  # config_path should be in message
-        finally:
-            os.unlink(path)
+        client = ClientV2.__new__(ClientV2)
+        with pytest.raises(TypeError) as exc_info:
+            client._read_config(path, explicit=True)
+        assert "api_key in config file" in str(exc_info.value)
+        assert "must be a string" in str(exc_info.value)
+        assert path in str(exc_info.value)  # config_path should be in message
 
-    def test_warning_message_includes_file_path(self):
+    def test_warning_message_includes_file_path(self, tmp_path):
         """Warning message should include the file path."""
         from jquants import ClientV2
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write("invalid {{{")
-            path = f.name
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("invalid {{{")
+        path = str(config_path)
 
-        try:
-            client = ClientV2.__new__(ClientV2)
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                client._read_config(path, explicit=False)
+        client = ClientV2.__new__(ClientV2)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            client._read_config(path, explicit=False)
 
-                assert len(w) == 1
-                assert path in str(w[0].message)
-        finally:
-            os.unlink(path)
+            assert len(w) == 1
+            assert path in str(w[0].message)
 
 
 class TestClientV2TOMLExplicit:
@@ -371,32 +374,163 @@ class TestClientV2TOMLExplicit:
         with pytest.raises(FileNotFoundError):
             client._read_config("/nonexistent/path.toml", explicit=True)
 
-    def test_explicit_permission_error_raises(self):
+    def test_explicit_permission_error_raises(self, tmp_path):
         """Explicit config with permission error should raise PermissionError."""
         from jquants import ClientV2
 
+        path = str(tmp_path / "jquants-api.toml")
+        Path(path).write_text('[jquants-api-client]\napi_key = "key"\n')
+
         client = ClientV2.__new__(ClientV2)
         with patch("builtins.open", side_effect=PermissionError("denied")):
-            with patch("os.path.isfile", return_value=True):
-                with pytest.raises(PermissionError):
-                    client._read_config("/some/path.toml", explicit=True)
+            with pytest.raises(PermissionError):
+                client._read_config(path, explicit=True)
 
-    def test_explicit_invalid_toml_raises(self):
+    def test_explicit_invalid_toml_raises(self, tmp_path):
         """Explicit config with invalid TOML should raise TOMLDecodeError."""
         import tomllib
 
         from jquants import ClientV2
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write("invalid {{{")
-            path = f.name
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("invalid {{{")
+        path = str(config_path)
+
+        client = ClientV2.__new__(ClientV2)
+        with pytest.raises(tomllib.TOMLDecodeError):
+            client._read_config(path, explicit=True)
+
+
+class TestClientV2TOMLCache:
+    """Test TOML parse cache keyed by (path, mtime_ns, size)."""
+
+    def test_same_file_parsed_once(self, tmp_path):
+        """Reading an unchanged file twice should parse it only once."""
+        from jquants import ClientV2
+        from jquants.client_v2 import _parse_toml_cached
+
+        path = str(tmp_path / "jquants-api.toml")
+        Path(path).write_text('[jquants-api-client]\napi_key = "cached_key"\n')
+
+        client = ClientV2.__new__(ClientV2)
+        _parse_toml_cached.cache_clear()
+        first = client._read_config(path, explicit=False)
+        second = client._read_config(path, explicit=False)
+
+        assert first == second == {"api_key": "cached_key"}
+        info = _parse_toml_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Changing the file (size/mtime) should invalidate the cached parse."""
+        from jquants import ClientV2
+
+        path = tmp_path / "jquants-api.toml"
+        path.write_text('[jquants-api-client]\napi_key = "old"\n')
+
+        client = ClientV2.__new__(ClientV2)
+        assert client._read_config(str(path))["api_key"] == "old"
+
+        path.write_text('[jquants-api-client]\napi_key = "newer"\n')
+        assert client._read_config(str(path))["api_key"] == "newer"
 
-        try:
-            client = ClientV2.__new__(ClientV2)
-            with pytest.raises(tomllib.TOMLDecodeError):
+    def test_decode_error_not_cached(self, tmp_path):
+        """A malformed file is re-read on every call and raises a fresh error."""
+        from jquants import ClientV2
+        from jquants.client_v2 import _parse_toml_cached
+
+        path = str(tmp_path / "jquants-api.toml")
+        Path(path).write_text("invalid toml syntax [[[")
+
+        client = ClientV2.__new__(ClientV2)
+        _parse_toml_cached.cache_clear()
+        with patch("builtins.open", wraps=open) as mock_open:
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                assert client._read_config(path, explicit=False) == {}
+                assert client._read_config(path, explicit=False) == {}
+
+            assert mock_open.call_count == 2
+            assert len(w) == 2
+            assert "Failed to read config file" in str(w[0].message)
+
+        assert _parse_toml_cached.cache_info().currsize == 0
+
+        errors = []
+        for _ in range(2):
+            with pytest.raises(tomllib.TOMLDecodeError) as exc_info:
                 client._read_config(path, explicit=True)
-        finally:
-            os.unlink(path)
+            errors.append(exc_info.value)
+        assert errors[0] is not errors[1]
+
+    def test_config_warning_respects_warning_filters(self, tmp_path):
+        """Deduplication is left to the warnings filters ("always" vs "once")."""
+        from jquants import ClientV2, JQuantsConfigWarning
+
+        path = tmp_path / "jquants-api.toml"
+        path.write_text("[jquants-api-client]\napi_key = 1\n")
+
+        client = ClientV2.__new__(ClientV2)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            client._read_config(str(path), explicit=False)
+            client._read_config(str(path), explicit=False)
+
+        assert len(w) == 2
+        assert all(issubclass(x.category, JQuantsConfigWarning) for x in w)
+        assert all(issubclass(x.category, UserWarning) for x in w)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("once", JQuantsConfigWarning)
+            client._read_config(str(path), explicit=False)
+            client._read_config(str(path), explicit=False)
+
+        assert len(w) == 1
+
+    def test_config_warning_error_filter_raises_every_time(self, tmp_path):
+        """Under an "error" filter every construction raises, not just the first."""
+        from jquants import ClientV2, JQuantsConfigWarning
+
+        path = tmp_path / "jquants-api.toml"
+        path.write_text("[jquants-api-client]\napi_key = 1\n")
+
+        client = ClientV2.__new__(ClientV2)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", JQuantsConfigWarning)
+            for _ in range(2):
+                with pytest.raises(JQuantsConfigWarning):
+                    client._read_config(str(path), explicit=False)
+
+    def test_utf8_content_parsed_from_memory(self, tmp_path):
+        """Non-ASCII (UTF-8) content should survive the read-then-parse path."""
+        from jquants import ClientV2
+
+        path = tmp_path / "jquants-api.toml"
+        path.write_bytes(
+            '# 設定ファイル\n[jquants-api-client]\napi_key = "キー"\n'.encode("utf-8")
+        )
+
+        client = ClientV2.__new__(ClientV2)
+        assert client._read_config(str(path)) == {"api_key": "キー"}
+
+    def test_returned_section_is_not_shared(self, tmp_path):
+        """Mutating a returned section must not affect later reads."""
+        from jquants import ClientV2
+
+        path = str(tmp_path / "jquants-api.toml")
+        Path(path).write_text("[jquants-api-client]\napi_key = 12345\n")
+
+        client = ClientV2.__new__(ClientV2)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            # Implicit read deletes the invalid api_key from its section
+            assert "api_key" not in client._read_config(path, explicit=False)
+            assert len(w) == 1
+
+        # Explicit read of the same (cached) file still sees the raw value
+        with pytest.raises(TypeError):
+            client._read_config(path, explicit=True)
 
 
 class TestClientV2Colab:
@@ -467,6 +601,13 @@ class TestClientV2Headers:
         expected_ua = f"jqapi-python/{__version__}/v2 p/{platform.python_version()}"
         assert headers["User-Agent"] == expected_ua
 
+    def test_base_headers_built_once(self):
+        """_base_headers() should return the dict built at construction."""
+        from jquants import ClientV2
+
+        client = ClientV2(api_key="test_api_key")
+        assert client._base_headers() is client._base_headers()
+
 
 class TestClientV2HTTPSession:
     """Test HTTP session management."""
@@ -1280,6 +1421,21 @@ class TestClientV2ToDataframe:
         assert len(result) == 0
         assert list(result.columns) == columns
 
+    def test_empty_result_is_independent_copy(self):
+        """Empty results share a cached prototype but must not alias it."""
+        from jquants import ClientV2
+
+        client = ClientV2(api_key="test_api_key")
+        columns = ["Code", "Date", "Value"]
+
+        first = client._to_dataframe([], columns, date_columns=["Date"])
+        first["Extra"] = pd.Series(dtype=object)
+        second = client._to_dataframe([], columns, date_columns=["Date"])
+
+        assert first is not second
+        assert list(second.columns) == columns
+        assert pd.api.types.is_datetime64_any_dtype(second["Date"])
+
     def test_column_order_applied(self):
         """H013: _to_dataframe() should apply correct column order."""
         from jquants import ClientV2
@@ -1320,6 +1476,43 @@ class TestClientV2ToDataframe:
         assert result.iloc[0]["Code"] == "1301"
         assert result.iloc[1]["Code"] == "1302"
 
+    def test_sort_skipped_when_already_sorted(self):
+        """_to_dataframe() should not call sort_values on pre-sorted data."""
+        from jquants import ClientV2
+
+        client = ClientV2(api_key="test_api_key")
+        # Lexicographically sorted by (Date, Code); Code alone is not monotonic
+        data = [
+            {"Code": "1302", "Date": "2024-01-01"},
+            {"Code": "1303", "Date": "2024-01-01"},
+            {"Code": "1301", "Date": "2024-01-02"},
+        ]
+
+        with patch.object(pd.DataFrame, "sort_values") as mock_sort:
+            result = client._to_dataframe(
+                data, ["Code", "Date"], sort_columns=["Date", "Code"]
+            )
+
+        mock_sort.assert_not_called()
+        assert list(result["Code"]) == ["1302", "1303", "1301"]
+        assert list(result.index) == [0, 1, 2]
+
+    def test_sort_applied_when_key_has_nan(self):
+        """_to_dataframe() should still sort (NaN last) when a key has NaN."""
+        from jquants import ClientV2
+
+        client = ClientV2(api_key="test_api_key")
+        data = [
+            {"Code": "1301", "Date": ""},
+            {"Code": "1302", "Date": "2024-01-01"},
+        ]
+
+        result = client._to_dataframe(
+            data, ["Code", "Date"], date_columns=["Date"], sort_columns=["Date"]
+        )
+
+        assert list(result["Code"]) == ["1302", "1301"]
+
     def test_missing_columns_ignored(self):
         """H016: _to_dataframe() should ignore columns not in API response."""
         from jquants import ClientV2
@@ -1334,6 +1527,51 @@ class TestClientV2ToDataframe:
         assert "Date" in result.columns
         assert "ExtraColumn" not in result.columns
 
+    def test_column_present_only_in_later_record_kept(self):
+        """_to_dataframe() should keep columns that appear in any record."""
+        from jquants import ClientV2
+
+        client = ClientV2(api_key="test_api_key")
+        data = [
+            {"Code": "1301", "Date": "2024-01-01"},
+            {"Code": "1302", "Date": "2024-01-01", "Value": 1},
+        ]
+        columns = ["Code", "Date", "Value"]
+
+        result = client._to_dataframe(data, columns)
+
+        assert list(result.columns) == columns
+        assert pd.isna(result.iloc[0]["Value"])
+        assert result.iloc[1]["Value"] == 1
+
+    def test_no_known_columns_keeps_row_count(self):
+        """_to_dataframe() should keep N rows when no expected column is present."""
+        from jquants import ClientV2
+
+        client = ClientV2(api_key="test_api_key")
+        data = [{"Renamed": "1301"}, {"Renamed": "1302"}]
+
+        result = client._to_dataframe(data, ["Code", "Date"], date_columns=["Date"])
+
+        assert result.shape == (2, 0)
+
+    def test_date_columns_accept_iso8601_variants(self):
+        """_to_dataframe() should parse ISO 8601 dates with or without time."""
+        from jquants import ClientV2
+
+        client = ClientV2(api_key="test_api_key")
+        data = [
+            {"Code": "1301", "Date": "2024-01-15"},
+            {"Code": "1302", "Date": "2024-01-16T00:00:00"},
+        ]
+
+        result = client._to_dataframe(data, ["Code", "Date"], date_columns=["Date"])
+
+        assert list(result["Date"]) == [
+            pd.Timestamp("2024-01-15"),
+            pd.Timestamp("2024-01-16"),
+        ]
+
     def test_date_columns_none_skips_conversion(self):
         """H017: _to_dataframe() should skip date conversion when date_columns=None."""
         from jquants import ClientV2
@@ -1510,7 +1748,7 @@ class TestClientV2NetworkExceptionsPassthrough:
 
 
 class TestClientV2RateLimitParameters:
-    """Test ClientV2 rate limit parameters (CV2-RATE-001~009)."""
+    """Test ClientV2 rate limit parameters (CV2-RATE-001~010)."""
 
     def test_rate_limit_none_defaults_to_5(self):
         """CV2-RATE-001: rate_limit=None → デフォルト5"""
@@ -1648,6 +1886,30 @@ class TestClientV2RateLimitParameters:
         client = ClientV2(api_key="test_api_key", retry_max_attempts=0)
         assert client._retry_max_attempts == 0
 
+    def test_burst_default_is_1(self):
+        """CV2-RATE-010: burst=1 → デフォルト（バーストなし）"""
+        from jquants import ClientV2
+
+        client = ClientV2(api_key="test_api_key")
+        assert client._burst == 1
+        assert client._pacer._burst_window_ns == 0
+
+    def test_burst_3_reflects_setting(self):
+        """CV2-RATE-010: burst=3 → Pacer に反映"""
+        from jquants import ClientV2
+
+        client = ClientV2(api_key="test_api_key", rate_limit=60, burst=3)
+        assert client._burst == 3
+        assert client._pacer._burst_window_ns == 2_000_000_000
+
+    def test_burst_zero_raises_valueerror(self):
+        """CV2-RATE-010: burst=0 → ValueError"""
+        from jquants import ClientV2
+
+        with pytest.raises(ValueError) as exc_info:
+            ClientV2(api_key="test_api_key", burst=0)
+        assert "burst" in str(exc_info.value).lower()
+
 
 class TestClientV2Options225DailyValidation:
     """Test get_options_225_daily() validation (OPT-001~004)."""
@@ -136,6 +136,22 @@ class TestGetIndexOption:
             assert len(result) == 0
             assert list(result.columns) == constants.DERIVATIVES_OPTIONS_225_COLUMNS
 
+    def test_empty_response_uses_cached_prototype_with_date_dtypes(self):
+        """Empty responses should share one typed prototype (Date/LTD/SQD datetime)."""
+        from jquants.client_v2 import _EMPTY_DF_CACHE
+
+        client = ClientV2(api_key="test_api_key")
+        _EMPTY_DF_CACHE.clear()
+
+        with patch.object(client, "_paginated_get", return_value=[]):
+            first = client.get_options_225_daily(date="2024-01-01")
+            second = client.get_options_225_daily(date="2024-01-02")
+
+        assert len(_EMPTY_DF_CACHE) == 1
+        assert first is not second
+        for col in constants.DERIVATIVES_OPTIONS_225_DATE_COLUMNS:
+            assert pd.api.types.is_datetime64_any_dtype(second[col])
+
     def test_date_columns_converted_to_timestamp(self):
         """Date, LTD, SQD columns should be converted to pd.Timestamp."""
         client = ClientV2(api_key="test_api_key")
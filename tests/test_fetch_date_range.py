@@ -338,6 +338,26 @@ class TestFetchDateRangeExecutionMode:
 
             mock_pool.assert_called_once_with(max_workers=3)
 
+    def test_single_day_skips_threadpool(self):
+        """Single day range should not create ThreadPoolExecutor even if max_workers > 1."""
+        client = ClientV2(api_key="test_api_key", max_workers=3)
+        mock_fetch = MagicMock(
+            return_value=pd.DataFrame({"Code": ["1301"], "Date": ["2024-01-15"]})
+        )
+
+        with patch("jquants.client_v2.ThreadPoolExecutor") as mock_pool:
+            result = client._fetch_date_range(
+                start_dt="2024-01-15",
+                end_dt="2024-01-15",
+                fetch_func=mock_fetch,
+                sort_columns=["Code", "Date"],
+                empty_columns=["Code", "Date"],
+            )
+
+            mock_pool.assert_not_called()
+            mock_fetch.assert_called_once_with("2024-01-15")
+            assert len(result) == 1
+
     def test_parallel_and_sequential_produce_same_result(self):
         """Sequential and parallel execution should produce identical results."""
         df1 = pd.DataFrame({"Code": ["1301"], "Date": ["2024-01-15"]})
@@ -8,122 +8,108 @@ import pytest
 
 from jquants import constants_v2
 
+# Fixed timestamps used in assertions (parsed once at import)
+TS_20240101 = pd.Timestamp("2024-01-01")
+TS_20240102 = pd.Timestamp("2024-01-02")
+TS_20240114 = pd.Timestamp("2024-01-14")
+TS_20240115 = pd.Timestamp("2024-01-15")
 
-class TestToDataframeEnsureAllColumns:
-    """Test _to_dataframe ensure_all_columns parameter."""
-
-    def test_ensure_all_columns_false_ignores_missing(self):
-        """ensure_all_columns=False should ignore missing columns (default behavior)."""
-        from jquants import ClientV2
-
-        client = ClientV2(api_key="test_api_key")
-        data = [{"Code": "1301", "DiscDate": "2024-01-01"}]
-        columns = ["Code", "DiscDate", "MissingColumn"]
-
-        result = client._to_dataframe(data, columns, ensure_all_columns=False)
-
-        assert "Code" in result.columns
-        assert "DiscDate" in result.columns
-        assert "MissingColumn" not in result.columns
-
-    def test_ensure_all_columns_true_fills_missing_with_nan(self):
-        """ensure_all_columns=True should add missing columns with NaN."""
-        from jquants import ClientV2
-
-        client = ClientV2(api_key="test_api_key")
-        data = [{"Code": "1301", "DiscDate": "2024-01-01"}]
-        columns = ["Code", "DiscDate", "MissingColumn"]
-
-        result = client._to_dataframe(data, columns, ensure_all_columns=True)
-
-        assert "Code" in result.columns
-        assert "DiscDate" in result.columns
-        assert "MissingColumn" in result.columns
-        assert pd.isna(result["MissingColumn"].iloc[0])
-
-    def test_ensure_all_columns_preserves_column_order(self):
-        """ensure_all_columns=True should preserve column order from definition."""
-        from jquants import ClientV2
-
-        client = ClientV2(api_key="test_api_key")
-        data = [{"B": 2, "A": 1}]
-        columns = ["A", "B", "C"]
-
-        result = client._to_dataframe(data, columns, ensure_all_columns=True)
 
-        assert list(result.columns) == ["A", "B", "C"]
+@pytest.fixture(scope="module")
+def client():
+    """Shared ClientV2 for pure _to_dataframe tests (no HTTP, no state)."""
+    from jquants import ClientV2
 
-    def test_empty_data_with_ensure_all_columns(self):
-        """Empty data with ensure_all_columns=True should return DataFrame with all columns."""
-        from jquants import ClientV2
-
-        client = ClientV2(api_key="test_api_key")
-        columns = ["A", "B", "C"]
+    return ClientV2(api_key="test_api_key")
 
-        result = client._to_dataframe([], columns, ensure_all_columns=True)
-
-        assert len(result) == 0
-        assert list(result.columns) == columns
-
-
-class TestToDataframeDateNaT:
-    """Test _to_dataframe date column NaT conversion."""
-
-    def test_empty_string_date_becomes_nat(self):
-        """Empty string in date column should become NaT."""
-        from jquants import ClientV2
-
-        client = ClientV2(api_key="test_api_key")
-        data = [{"Code": "1301", "DiscDate": ""}]
-        columns = ["Code", "DiscDate"]
-
-        result = client._to_dataframe(
-            data, columns, date_columns=["DiscDate"], ensure_all_columns=True
-        )
 
-        assert pd.isna(result["DiscDate"].iloc[0])
-
-    def test_none_date_becomes_nat(self):
-        """None in date column should become NaT."""
-        from jquants import ClientV2
-
-        client = ClientV2(api_key="test_api_key")
-        data = [{"Code": "1301", "DiscDate": None}]
-        columns = ["Code", "DiscDate"]
+class TestToDataframeEnsureAllColumns:
+    """Test _to_dataframe ensure_all_columns parameter."""
 
+    @pytest.mark.parametrize(
+        "data, columns, ensure_all_columns, expected_columns, expected_nan_col",
+        [
+            pytest.param(
+                [{"Code": "1301", "DiscDate": "2024-01-01"}],
+                ["Code", "DiscDate", "MissingColumn"],
+                False,
+                ["Code", "DiscDate"],
+                None,
+                id="false_ignores_missing",
+            ),
+            pytest.param(
+                [{"Code": "1301", "DiscDate": "2024-01-01"}],
+                ["Code", "DiscDate", "MissingColumn"],
+                True,
+                ["Code", "DiscDate", "MissingColumn"],
+                "MissingColumn",
+                id="true_fills_missing_with_nan",
+            ),
+            pytest.param(
+                [{"B": 2, "A": 1}],
+                ["A", "B", "C"],
+                True,
+                ["A", "B", "C"],
+                "C",
+                id="preserves_column_order",
+            ),
+            pytest.param(
+                [],
+                ["A", "B", "C"],
+                True,
+                ["A", "B", "C"],
+                None,
+                id="empty_data",
+            ),
+        ],
+    )
+    def test_ensure_all_columns(
+        self,
+        client,
+        data,
+        columns,
+        ensure_all_columns,
+        expected_columns,
+        expected_nan_col,
+    ):
+        """ensure_all_columns controls whether missing columns are added (as NaN, in order)."""
         result = client._to_dataframe(
-            data, columns, date_columns=["DiscDate"], ensure_all_columns=True
+            data, columns, ensure_all_columns=ensure_all_columns
         )
 
-        assert pd.isna(result["DiscDate"].iloc[0])
-
-    def test_valid_date_converted(self):
-        """Valid date string should be converted to Timestamp."""
-        from jquants import ClientV2
+        assert list(result.columns) == expected_columns
+        assert len(result) == len(data)
+        if expected_nan_col is not None:
+            assert pd.isna(result[expected_nan_col].iloc[0])
 
-        client = ClientV2(api_key="test_api_key")
-        data = [{"Code": "1301", "DiscDate": "2024-01-15"}]
-        columns = ["Code", "DiscDate"]
 
-        result = client._to_dataframe(
-            data, columns, date_columns=["DiscDate"], ensure_all_columns=True
-        )
-
-        assert result["DiscDate"].iloc[0] == pd.Timestamp("2024-01-15")
-
-    def test_invalid_date_coerced_to_nat(self):
-        """Invalid date like '0000-00-00' should become NaT with errors='coerce'."""
-        from jquants import ClientV2
+class TestToDataframeDateNaT:
+    """Test _to_dataframe date column NaT conversion."""
 
-        client = ClientV2(api_key="test_api_key")
-        data = [{"Code": "1301", "DiscDate": "0000-00-00"}]
-        columns = ["Code", "DiscDate"]
+    @pytest.mark.parametrize(
+        "disc_date, expected",
+        [
+            pytest.param("", None, id="empty_string_becomes_nat"),
+            pytest.param(None, None, id="none_becomes_nat"),
+            pytest.param("2024-01-15", TS_20240115, id="valid_date"),
+            pytest.param("0000-00-00", None, id="invalid_date_coerced_to_nat"),
+        ],
+    )
+    def test_date_conversion(self, client, disc_date, expected):
+        """Date columns become Timestamp; empty/None/invalid values become NaT."""
+        data = [{"Code": "1301", "DiscDate": disc_date}]
 
         result = client._to_dataframe(
-            data, columns, date_columns=["DiscDate"], ensure_all_columns=True
+            data,
+            ["Code", "DiscDate"],
+            date_columns=["DiscDate"],
+            ensure_all_columns=True,
         )
 
-        assert pd.isna(result["DiscDate"].iloc[0])
+        if expected is None:
+            assert pd.isna(result["DiscDate"].iloc[0])
+        else:
+            assert result["DiscDate"].iloc[0] == expected
 
 
 class TestFinsSummaryColumnsSpec:
@@ -374,7 +360,7 @@ class TestGetFinsSummary:
             result = client.get_fins_summary(date="2024-01-15")
 
             # Should be sorted: 2024-01-14 first, then 2024-01-15 with Code order
-            assert result.iloc[0]["DiscDate"] == pd.Timestamp("2024-01-14")
+            assert result.iloc[0]["DiscDate"] == TS_20240114
             assert result.iloc[1]["Code"] == "13010"
             assert result.iloc[2]["Code"] == "13020"
 
@@ -517,8 +503,8 @@ class TestGetSummaryRange:
             ]
             result = client.get_summary_range("2024-01-01", "2024-01-02")
 
-            assert result.iloc[0]["DiscDate"] == pd.Timestamp("2024-01-01")
-            assert result.iloc[1]["DiscDate"] == pd.Timestamp("2024-01-02")
+            assert result.iloc[0]["DiscDate"] == TS_20240101
+            assert result.iloc[1]["DiscDate"] == TS_20240102
 
     def test_empty_range_returns_empty_dataframe(self):
         """Empty results should return empty DataFrame with all columns."""
@@ -554,6 +540,26 @@ class TestGetSummaryRange:
                     result[col]
                 ), f"Empty DataFrame column {col} should have datetime dtype"
 
+    def test_business_days_only_skips_weekends(self):
+        """business_days_only=True should skip Saturday and Sunday."""
+        from jquants import ClientV2
+
+        client = ClientV2(api_key="test_api_key")
+
+        call_order = []
+
+        def track_calls(date=""):
+            call_order.append(date)
+            return pd.DataFrame(columns=constants_v2.FINS_SUMMARY_COLUMNS)
+
+        with patch.object(client, "get_fins_summary", side_effect=track_calls):
+            # 2024-01-05 (Fri) - 2024-01-08 (Mon)
+            client.get_summary_range(
+                "2024-01-05", "2024-01-08", business_days_only=True
+            )
+
+            assert call_order == ["2024-01-05", "2024-01-08"]
+
     def test_max_workers_1_sequential_execution(self):
         """max_workers=1 should execute sequentially (default)."""
         from jquants import ClientV2
@@ -574,8 +580,6 @@ class TestGetSummaryRange:
 
     def test_max_workers_greater_than_1_uses_threadpool(self):
         """max_workers > 1 should use ThreadPoolExecutor for parallel execution."""
-        from concurrent.futures import ThreadPoolExecutor
-
         from jquants import ClientV2
 
         client = ClientV2(api_key="test_api_key", max_workers=3)
@@ -585,9 +589,12 @@ class TestGetSummaryRange:
                 columns=constants_v2.FINS_SUMMARY_COLUMNS
             )
 
-            with patch(
-                "jquants.client_v2.ThreadPoolExecutor", wraps=ThreadPoolExecutor
-            ) as mock_pool:
+            # Fake executor: runs map() inline so no worker threads are spawned
+            with patch("jquants.client_v2.ThreadPoolExecutor") as mock_pool:
+                executor = mock_pool.return_value.__enter__.return_value
+                executor.map = lambda fn, items: [fn(x) for x in items]
+
                 client.get_summary_range("2024-01-01", "2024-01-03")
 
                 mock_pool.assert_called_once_with(max_workers=3)
+                assert mock_get.call_count == 3
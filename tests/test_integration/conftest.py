@@ -12,10 +12,32 @@ Run only unit tests (exclude integration):
 Run Premium tests (requires Premium plan):
     JQUANTS_PLAN=premium poetry run pytest -m "integration and premium"
     # or set plan = "premium" in jquants-api.toml
+
+Replay recorded responses (optional; modules using the response_cache fixture):
+    JQUANTS_TEST_RESPONSE_CACHE=/tmp/jquants-cache poetry run pytest -m integration tests/
+    # The first run records successful GET responses; later runs replay them.
+    # Cached files contain API data: keep the directory out of version control.
+
+Run in parallel (optional; pytest-xdist is not a project dependency):
+    poetry run pip install pytest-xdist
+    poetry run pytest -n 5 --dist=loadfile -m integration tests/
+    # loadfile keeps each module on one worker; session fixtures are per worker.
+    # Every worker's clients pace at the default 5 req/min independently, so
+    # n workers send up to n * 5 req/min: parallel runs need a plan whose
+    # limit covers that (Light or higher for -n 5).
 """
 
+import hashlib
+import json
 import os
-
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pandas as pd
 import pytest
 
 from jquants import ClientV2
@@ -40,10 +62,14 @@ def _load_toml_config() -> dict:
     return {}
 
 
+@lru_cache(maxsize=None)
 def _get_api_key() -> str | None:
     """Get API key from environment variable or TOML config.
 
     Priority: environment variable > jquants-api.toml
+
+    Cached for the session, so per-test fixtures do not re-read the
+    environment or re-parse jquants-api.toml.
     """
     # 1. Environment variable
     env_key = os.environ.get("JQUANTS_API_KEY")
@@ -82,11 +108,13 @@ def _get_plan() -> str:
     return "standard"
 
 
+@lru_cache(maxsize=None)
 def _has_api_key() -> bool:
     """Check if API key is available."""
     return _get_api_key() is not None
 
 
+@lru_cache(maxsize=None)
 def _is_premium() -> bool:
     """Check if current plan is Premium or higher."""
     return _get_plan() == "premium"
@@ -95,22 +123,88 @@ def _is_premium() -> bool:
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line("markers", "premium: Premium plan required")
+    config.addinivalue_line("markers", "requires_api_key: API key required")
+    config.addinivalue_line("markers", "requires_premium: Premium plan required")
 
 
-# Skip marker for tests requiring API key
-requires_api_key = pytest.mark.skipif(
-    not _has_api_key(),
-    reason="JQUANTS_API_KEY not set and jquants-api.toml not found",
-)
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Skip tests whose API key / plan requirements are not met.
 
-# Skip marker for tests requiring Premium plan
-requires_premium = pytest.mark.skipif(
-    not _is_premium(),
-    reason="Premium plan required (set JQUANTS_PLAN=premium or plan='premium' in jquants-api.toml)",
-)
+    The checks read environment variables and jquants-api.toml, so they are
+    evaluated lazily here (and only for integration tests) instead of at
+    import time. ``trylast`` runs this after pytest's ``-m`` deselection, so
+    unit-only runs (``-m "not integration"``) never touch them.
+    """
+    for item in items:
+        if item.get_closest_marker("integration") is None:
+            continue
+        if item.get_closest_marker("requires_api_key") and not _has_api_key():
+            item.add_marker(
+                pytest.mark.skip(
+                    reason="JQUANTS_API_KEY not set and jquants-api.toml not found"
+                )
+            )
+        if item.get_closest_marker("requires_premium") and not _is_premium():
+            item.add_marker(
+                pytest.mark.skip(
+                    reason="Premium plan required (set JQUANTS_PLAN=premium or "
+                    "plan='premium' in jquants-api.toml)"
+                )
+            )
+
+
+def assert_sorted_by(df: pd.DataFrame, columns: list[str]) -> None:
+    """Assert df rows are in ascending lexicographic order of columns.
+
+    Uses pandas' compiled monotonicity check on a MultiIndex of the key
+    columns instead of per-row ``.iloc``/``iterrows`` comparisons.
+
+    Rows with NaN/NaT in any key column are excluded from the check (the
+    MultiIndex check reports them as unsorted), so keys that may be missing,
+    such as DiscTime, do not fail an otherwise sorted frame.
 
+    Args:
+        df: DataFrame to check
+        columns: Sort key columns, most significant first
+    """
+    key_frame = df[columns].dropna()
+    if len(key_frame) < 2:
+        return
+    keys = pd.MultiIndex.from_frame(key_frame)
+    assert (
+        keys.is_monotonic_increasing
+    ), f"DataFrame should be sorted by {', '.join(columns)}"
 
-@pytest.fixture(scope="module")
+
+# Skip marker for tests requiring API key (resolved in pytest_collection_modifyitems)
+requires_api_key = pytest.mark.requires_api_key
+
+# Skip marker for tests requiring Premium plan (resolved in pytest_collection_modifyitems)
+requires_premium = pytest.mark.requires_premium
+
+
+@pytest.fixture(autouse=True)
+def _stabilize_env(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Export the resolved API key as JQUANTS_API_KEY for integration tests.
+
+    ``ClientV2()`` then resolves the key from the environment and skips the
+    implicit TOML files. Only items marked ``integration`` are affected, so
+    unit tests in this directory never read or see the credentials. Tests
+    that need the variable unset (AUTH-003/005/009) override it with
+    ``monkeypatch.delenv``.
+    """
+    if request.node.get_closest_marker("integration") is None:
+        return
+    # Resolved once per session; only the setenv is repeated per test
+    key = _get_api_key()
+    if key is not None:
+        monkeypatch.setenv("JQUANTS_API_KEY", key)
+
+
+@pytest.fixture(scope="session")
 def api_key() -> str:
     """Get API key for tests.
 
@@ -123,12 +217,12 @@ def api_key() -> str:
     return key
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def client(api_key: str) -> ClientV2:
     """Create ClientV2 instance with valid API key.
 
-    This fixture creates a single client instance per test module,
-    reusing the same session for efficiency.
+    This fixture creates a single client instance per test session,
+    reusing the same HTTP session (connection pool) across modules.
 
     Args:
         api_key: Valid J-Quants API key
@@ -139,6 +233,170 @@ def client(api_key: str) -> ClientV2:
     return ClientV2(api_key=api_key)
 
 
+@pytest.fixture(scope="session")
+def equities_master_raw(client: ClientV2) -> list[dict]:
+    """Fetch raw /equities/master records once per test session.
+
+    Tests that only need raw records to feed ``_to_dataframe`` share this
+    result instead of paginating the endpoint themselves. Treat as read-only.
+
+    Args:
+        client: Session-scoped ClientV2 instance
+
+    Returns:
+        list[dict]: Raw records from /equities/master
+    """
+    return client._paginated_get("/equities/master")
+
+
+@pytest.fixture(scope="session")
+def options_225_20241227(client: ClientV2) -> pd.DataFrame:
+    """Fetch Nikkei 225 options for 2024-12-27 once per test session.
+
+    Shared by read-only derivatives assertions. Treat as read-only.
+
+    Args:
+        client: Session-scoped ClientV2 instance
+
+    Returns:
+        pd.DataFrame: get_options_225_daily(date="2024-12-27") result
+    """
+    return client.get_options_225_daily(date="2024-12-27")
+
+
+@pytest.fixture(scope="module")
+def cached_call(client: ClientV2) -> Callable[..., pd.DataFrame]:
+    """Memoize identical ClientV2 getter calls within a test module.
+
+    Tests that repeat the same request (e.g. a filter check and a column order
+    check on ``get_listed_info(code="72030")``) share one API call. Each call
+    returns a copy, so tests may mutate the result freely.
+
+    Args:
+        client: Session-scoped ClientV2 instance
+
+    Returns:
+        Callable: ``cached_call(method_name, **kwargs)`` returning a DataFrame
+    """
+    cache: dict[tuple[str, frozenset], pd.DataFrame] = {}
+
+    def _call(method_name: str, **kwargs) -> pd.DataFrame:
+        key = (method_name, frozenset(kwargs.items()))
+        if key not in cache:
+            cache[key] = getattr(client, method_name)(**kwargs)
+        return cache[key].copy()
+
+    return _call
+
+
+@pytest.fixture(scope="module")
+def client_factory() -> Callable[..., ClientV2]:
+    """Build offline ClientV2 instances, one per distinct set of kwargs.
+
+    For tests that only read configuration attributes (``_rate_limit``,
+    ``_pacer.interval``, ``_retry_*``). Instances are shared within the
+    module, so tests that call ``_pacer.wait()`` or patch the client must
+    construct their own ``ClientV2`` instead.
+
+    Returns:
+        Callable: ``client_factory(**kwargs)`` returning a cached ClientV2
+    """
+
+    @lru_cache(maxsize=None)
+    def _build(**kwargs) -> ClientV2:
+        return ClientV2(api_key="test_api_key", **kwargs)
+
+    return _build
+
+
+@pytest.fixture
+def response_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Record/replay successful GET responses on disk (opt-in).
+
+    Enabled only when JQUANTS_TEST_RESPONSE_CACHE points to a directory.
+    Responses are keyed by path and query parameters (not by API key) and
+    stored as JSON. Errors are raised before anything is stored, so error
+    tests always hit the API. Session- and module-scoped data fixtures are
+    built before this fixture is applied and are not cached.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture
+    """
+    cache_dir = os.environ.get("JQUANTS_TEST_RESPONSE_CACHE")
+    if not cache_dir:
+        return
+    cache_path = Path(cache_dir)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    original = ClientV2._execute_json_request
+
+    def cached_execute_json_request(
+        self: ClientV2,
+        method: str,
+        path: str,
+        *,
+        params: dict | None = None,
+        json_data: dict | None = None,
+    ) -> dict:
+        if method != "GET" or json_data is not None:
+            return original(self, method, path, params=params, json_data=json_data)
+        key = json.dumps([path, params or {}], sort_keys=True)
+        entry = cache_path / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+        if entry.is_file():
+            return json.loads(entry.read_text(encoding="utf-8"))
+        result = original(self, method, path, params=params)
+        # Write to a temp file and rename, so a concurrent xdist worker never
+        # reads a partially written entry
+        fd, tmp = tempfile.mkstemp(dir=cache_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp, entry)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return result
+
+    monkeypatch.setattr(ClientV2, "_execute_json_request", cached_execute_json_request)
+
+
+class _RateLimitedHandler(BaseHTTPRequestHandler):
+    """Answer every GET with a J-Quants style 429 JSON error."""
+
+    def do_GET(self) -> None:
+        body = json.dumps({"message": "Rate limit exceeded"}).encode()
+        self.send_response(429)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Keep test output quiet."""
+
+
+@pytest.fixture(scope="module")
+def fake_jquants_server() -> Iterator[str]:
+    """Serve 429 responses from a local HTTP server on an ephemeral port.
+
+    Point a client at it with ``client.JQUANTS_API_BASE = fake_jquants_server``
+    to exercise the real requests/urllib3 path without network access. Also
+    set ``client._request_session().trust_env = False`` so an ``HTTP(S)_PROXY``
+    in the environment does not route the request away from 127.0.0.1.
+
+    Yields:
+        str: Base URL (``http://127.0.0.1:<port>``)
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RateLimitedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
 @pytest.fixture
 def fresh_client(api_key: str) -> ClientV2:
     """Create a fresh ClientV2 instance for each test.
@@ -154,7 +412,7 @@ def fresh_client(api_key: str) -> ClientV2:
     return ClientV2(api_key=api_key)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_api_key() -> str:
     """Return an invalid API key for error testing."""
     return "invalid-api-key-for-testing-12345"
@@ -10,6 +10,8 @@ import pytest
 from jquants import ClientV2
 from jquants.constants_v2 import EQUITIES_MASTER_COLUMNS
 
+from .conftest import assert_sorted_by
+
 # Mark all tests in this module as integration tests
 pytestmark = pytest.mark.integration
 
@@ -17,16 +19,20 @@ pytestmark = pytest.mark.integration
 class TestDataFrameNormal:
     """Normal DataFrame conversion test cases."""
 
-    def test_df_001_api_response_to_dataframe(self, client: ClientV2) -> None:
+    def test_df_001_api_response_to_dataframe(
+        self, client: ClientV2, equities_master_raw: list[dict]
+    ) -> None:
         """DF-001: API response is converted to pandas DataFrame."""
-        data = client._paginated_get("/equities/master")
+        data = equities_master_raw
         df = client._to_dataframe(data, columns=EQUITIES_MASTER_COLUMNS)
         assert isinstance(df, pd.DataFrame)
         assert len(df) > 0
 
-    def test_df_002_column_order(self, client: ClientV2) -> None:
+    def test_df_002_column_order(
+        self, client: ClientV2, equities_master_raw: list[dict]
+    ) -> None:
         """DF-002: Column order follows constants_v2.py definition."""
-        data = client._paginated_get("/equities/master")
+        data = equities_master_raw
         df = client._to_dataframe(data, columns=EQUITIES_MASTER_COLUMNS)
 
         # Columns should be in the order defined in constants
@@ -34,9 +40,11 @@ class TestDataFrameNormal:
         actual_order = list(df.columns)
         assert actual_order == expected_order
 
-    def test_df_003_date_column_type(self, client: ClientV2) -> None:
+    def test_df_003_date_column_type(
+        self, client: ClientV2, equities_master_raw: list[dict]
+    ) -> None:
         """DF-003: Date columns are converted to pd.Timestamp."""
-        data = client._paginated_get("/equities/master")
+        data = equities_master_raw
         df = client._to_dataframe(
             data,
             columns=EQUITIES_MASTER_COLUMNS,
@@ -46,9 +54,11 @@ class TestDataFrameNormal:
             # Check dtype is datetime64
             assert pd.api.types.is_datetime64_any_dtype(df["Date"])
 
-    def test_df_004_sorting_applied(self, client: ClientV2) -> None:
+    def test_df_004_sorting_applied(
+        self, client: ClientV2, equities_master_raw: list[dict]
+    ) -> None:
         """DF-004: Sorting is correctly applied."""
-        data = client._paginated_get("/equities/master")
+        data = equities_master_raw
         df = client._to_dataframe(
             data,
             columns=EQUITIES_MASTER_COLUMNS,
@@ -57,16 +67,18 @@ class TestDataFrameNormal:
         )
         if "Date" in df.columns and "Code" in df.columns:
             # Verify sorted by Date, then Code
-            df_sorted = df.sort_values(["Date", "Code"]).reset_index(drop=True)
-            pd.testing.assert_frame_equal(df, df_sorted)
+            assert_sorted_by(df, ["Date", "Code"])
+            assert df.index.equals(pd.RangeIndex(len(df)))
 
 
 class TestDataFrameRare:
     """Rare/edge case DataFrame tests."""
 
-    def test_df_005_missing_columns_ignored(self, client: ClientV2) -> None:
+    def test_df_005_missing_columns_ignored(
+        self, client: ClientV2, equities_master_raw: list[dict]
+    ) -> None:
         """DF-005: Columns not in API response are ignored (Free vs Premium)."""
-        data = client._paginated_get("/equities/master")
+        data = equities_master_raw
         df = client._to_dataframe(data, columns=EQUITIES_MASTER_COLUMNS)
 
         # Some columns may be Premium-only (e.g., Mrgn, MrgnNm)
@@ -18,12 +18,12 @@ class TestDerivativesIntegration:
     """Integration tests for Derivatives endpoints."""
 
     @requires_api_key
-    def test_get_options_225_daily(self, client):
+    def test_get_options_225_daily(self, options_225_20241227):
         """Test get_options_225_daily returns valid DataFrame.
 
         Note: The endpoint returns Nikkei 225 option data for the specified date.
         """
-        df = client.get_options_225_daily(date="2024-12-27")
+        df = options_225_20241227
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
@@ -43,9 +43,9 @@ class TestDerivativesIntegration:
                 assert df["Code"].is_monotonic_increasing
 
     @requires_api_key
-    def test_get_options_225_daily_column_types(self, client):
+    def test_get_options_225_daily_column_types(self, options_225_20241227):
         """Test get_options_225_daily returns correct column types."""
-        df = client.get_options_225_daily(date="2024-12-27")
+        df = options_225_20241227
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
@@ -78,14 +78,9 @@ class TestDerivativesIntegration:
 
             # Check sorted by Code, Date
             if len(df) > 1:
-                for i in range(len(df) - 1):
-                    code_i = df.iloc[i]["Code"]
-                    code_next = df.iloc[i + 1]["Code"]
-                    date_i = df.iloc[i]["Date"]
-                    date_next = df.iloc[i + 1]["Date"]
-                    assert (code_i < code_next) or (
-                        code_i == code_next and date_i <= date_next
-                    )
+                assert df["Code"].is_monotonic_increasing
+                dates_by_code = df.groupby("Code", sort=False)["Date"]
+                assert dates_by_code.is_monotonic_increasing.all()
 
     @requires_api_key
     def test_get_options_225_daily_empty_date(self, client):
@@ -103,9 +98,9 @@ class TestDerivativesIntegration:
         assert list(df.columns) == constants.DERIVATIVES_OPTIONS_225_COLUMNS
 
     @requires_api_key
-    def test_column_order_matches_constants(self, client):
+    def test_column_order_matches_constants(self, options_225_20241227):
         """Test that returned DataFrame columns match constants definition order."""
-        df = client.get_options_225_daily(date="2024-12-27")
+        df = options_225_20241227
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
@@ -16,7 +16,17 @@ import pytest
 
 from jquants import constants_v2 as constants
 
-from .conftest import requires_api_key
+from .conftest import assert_sorted_by, requires_api_key
+
+# Expected date values, parsed once at import
+T_20240101 = pd.Timestamp("2024-01-01")
+T_20240104 = pd.Timestamp("2024-01-04")
+T_20240105 = pd.Timestamp("2024-01-05")
+T_20240110 = pd.Timestamp("2024-01-10")
+T_20240331 = pd.Timestamp("2024-03-31")
+
+# Opt-in on-disk replay (JQUANTS_TEST_RESPONSE_CACHE), see conftest.response_cache
+pytestmark = pytest.mark.usefixtures("response_cache")
 
 
 @pytest.mark.integration
@@ -48,14 +58,14 @@ class TestEquitiesIntegration:
         assert df["Code"].is_monotonic_increasing
 
     @requires_api_key
-    def test_get_listed_info_with_code(self, client):
+    def test_get_listed_info_with_code(self, cached_call):
         """Test get_listed_info with code filter."""
-        df = client.get_listed_info(code="72030")
+        df = cached_call("get_listed_info", code="72030")
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
             # Should filter by code
-            assert all(df["Code"] == "72030")
+            assert (df["Code"] == "72030").all()
 
     @requires_api_key
     def test_get_listed_info_with_date(self, client):
@@ -66,16 +76,16 @@ class TestEquitiesIntegration:
         if not df.empty:
             # Check Date is datetime and matches filter
             assert pd.api.types.is_datetime64_any_dtype(df["Date"])
-            assert all(df["Date"] == pd.Timestamp("2024-01-04"))
+            assert (df["Date"] == T_20240104).all()
 
     # ========================================
     # get_prices_daily_quotes() tests
     # ========================================
 
     @requires_api_key
-    def test_get_prices_daily_quotes_by_code(self, client):
+    def test_get_prices_daily_quotes_by_code(self, cached_call):
         """Test get_prices_daily_quotes with code filter."""
-        df = client.get_prices_daily_quotes(code="72030")
+        df = cached_call("get_prices_daily_quotes", code="72030")
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
@@ -89,7 +99,7 @@ class TestEquitiesIntegration:
             assert pd.api.types.is_datetime64_any_dtype(df["Date"])
 
             # Check sorted by Code, Date
-            assert all(df["Code"] == "72030")
+            assert (df["Code"] == "72030").all()
             assert df["Date"].is_monotonic_increasing
 
     @requires_api_key
@@ -101,7 +111,7 @@ class TestEquitiesIntegration:
         if not df.empty:
             # Check Date is datetime and matches filter
             assert pd.api.types.is_datetime64_any_dtype(df["Date"])
-            assert all(df["Date"] == pd.Timestamp("2024-01-04"))
+            assert (df["Date"] == T_20240104).all()
 
             # Check sorted by Code
             assert df["Code"].is_monotonic_increasing
@@ -118,8 +128,8 @@ class TestEquitiesIntegration:
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
             # Check date range
-            min_date = pd.Timestamp("2024-01-04")
-            max_date = pd.Timestamp("2024-01-10")
+            min_date = T_20240104
+            max_date = T_20240110
             assert df["Date"].min() >= min_date
             assert df["Date"].max() <= max_date
 
@@ -161,13 +171,7 @@ class TestEquitiesIntegration:
             assert pd.api.types.is_datetime64_any_dtype(df["Date"])
 
             # Check sorted by Date, Code
-            if len(df) > 1:
-                for i in range(len(df) - 1):
-                    assert (
-                        df.iloc[i]["Date"] < df.iloc[i + 1]["Date"]
-                        or df.iloc[i]["Date"] == df.iloc[i + 1]["Date"]
-                        and df.iloc[i]["Code"] <= df.iloc[i + 1]["Code"]
-                    )
+            assert_sorted_by(df, ["Date", "Code"])
 
     # ========================================
     # get_price_range() tests
@@ -187,23 +191,14 @@ class TestEquitiesIntegration:
             assert pd.api.types.is_datetime64_any_dtype(df["Date"])
 
             # Check date range
-            min_date = pd.Timestamp("2024-01-04")
-            max_date = pd.Timestamp("2024-01-05")
+            min_date = T_20240104
+            max_date = T_20240105
             assert df["Date"].min() >= min_date
             assert df["Date"].max() <= max_date
 
             # Check sorted by Code, Date
             # (sorted by Code first, then Date within each Code)
-            prev_code = None
-            prev_date = None
-            for _, row in df.iterrows():
-                if prev_code is not None:
-                    if row["Code"] == prev_code:
-                        assert row["Date"] >= prev_date
-                    else:
-                        assert row["Code"] >= prev_code
-                prev_code = row["Code"]
-                prev_date = row["Date"]
+            assert_sorted_by(df, ["Code", "Date"])
 
     @requires_api_key
     def test_get_price_range_single_day(self, client):
@@ -216,7 +211,7 @@ class TestEquitiesIntegration:
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
             # All dates should be the same
-            assert all(df["Date"] == pd.Timestamp("2024-01-04"))
+            assert (df["Date"] == T_20240104).all()
 
     @requires_api_key
     def test_get_price_range_invalid_date_order(self, client):
@@ -232,9 +227,9 @@ class TestEquitiesIntegration:
     # ========================================
 
     @requires_api_key
-    def test_listed_info_column_order(self, client):
+    def test_listed_info_column_order(self, cached_call):
         """Test that get_listed_info columns match constants definition order."""
-        df = client.get_listed_info(code="72030")
+        df = cached_call("get_listed_info", code="72030")
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
@@ -244,9 +239,9 @@ class TestEquitiesIntegration:
             assert list(df.columns) == expected_cols
 
     @requires_api_key
-    def test_prices_daily_quotes_column_order(self, client):
+    def test_prices_daily_quotes_column_order(self, cached_call):
         """Test that get_prices_daily_quotes columns match constants definition order."""
-        df = client.get_prices_daily_quotes(code="72030")
+        df = cached_call("get_prices_daily_quotes", code="72030")
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
@@ -279,25 +274,17 @@ class TestEquitiesIntegration:
             assert pd.api.types.is_datetime64_any_dtype(df["EnDate"])
 
             # Check sorted by PubDate, Section
-            if len(df) > 1:
-                for i in range(len(df) - 1):
-                    curr_date = df.iloc[i]["PubDate"]
-                    next_date = df.iloc[i + 1]["PubDate"]
-                    assert (
-                        curr_date < next_date
-                        or curr_date == next_date
-                        and df.iloc[i]["Section"] <= df.iloc[i + 1]["Section"]
-                    )
+            assert_sorted_by(df, ["PubDate", "Section"])
 
     @requires_api_key
-    def test_get_equities_investor_types_with_section(self, client):
+    def test_get_equities_investor_types_with_section(self, cached_call):
         """Test get_equities_investor_types with section filter."""
-        df = client.get_equities_investor_types(section="TSEPrime")
+        df = cached_call("get_equities_investor_types", section="TSEPrime")
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
             # Should filter by section
-            assert all(df["Section"] == "TSEPrime")
+            assert (df["Section"] == "TSEPrime").all()
 
     @requires_api_key
     def test_get_equities_investor_types_with_date_range(self, client):
@@ -310,15 +297,15 @@ class TestEquitiesIntegration:
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
             # Check date range (PubDate should be within range)
-            min_date = pd.Timestamp("2024-01-01")
-            max_date = pd.Timestamp("2024-03-31")
+            min_date = T_20240101
+            max_date = T_20240331
             assert df["PubDate"].min() >= min_date
             assert df["PubDate"].max() <= max_date
 
     @requires_api_key
-    def test_get_equities_investor_types_column_order(self, client):
+    def test_get_equities_investor_types_column_order(self, cached_call):
         """Test that get_equities_investor_types columns match constants definition order."""
-        df = client.get_equities_investor_types(section="TSEPrime")
+        df = cached_call("get_equities_investor_types", section="TSEPrime")
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
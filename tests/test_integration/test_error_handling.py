@@ -16,18 +16,39 @@ from jquants.exceptions import JQuantsAPIError, JQuantsForbiddenError
 pytestmark = pytest.mark.integration
 
 
+@pytest.fixture(scope="class")
+def bad_client(invalid_api_key: str) -> ClientV2:
+    """Create one ClientV2 with an invalid API key per test class.
+
+    Only used for requests that fail with 403, so sharing it is safe and
+    lets consecutive errors reuse the same keep-alive connection.
+    """
+    return ClientV2(api_key=invalid_api_key)
+
+
+@pytest.fixture(scope="class")
+def forbidden_exc(bad_client: ClientV2) -> JQuantsForbiddenError:
+    """Issue one request with an invalid API key and capture the 403 error.
+
+    ERR-001/005/006/007 only inspect the resulting exception, so they share
+    a single request per class instead of each hitting the API.
+    """
+    with pytest.raises(JQuantsForbiddenError) as exc_info:
+        bad_client._request("GET", "/equities/master")
+    return exc_info.value
+
+
 class TestErrorHandlingNormal:
     """Normal error handling test cases."""
 
-    def test_err_001_403_invalid_api_key(self, invalid_api_key: str) -> None:
+    def test_err_001_403_invalid_api_key(
+        self, forbidden_exc: JQuantsForbiddenError
+    ) -> None:
         """ERR-001: Invalid API key raises JQuantsForbiddenError (403).
 
         Note: V2 API returns 403 (not 401) for invalid API keys.
         """
-        client = ClientV2(api_key=invalid_api_key)
-        with pytest.raises(JQuantsForbiddenError) as exc_info:
-            client._request("GET", "/equities/master")
-        assert exc_info.value.status_code == 403
+        assert forbidden_exc.status_code == 403
 
     def test_err_002_403_plan_restriction(self) -> None:
         """ERR-002: Plan restriction raises JQuantsForbiddenError (403).
@@ -56,27 +77,24 @@ class TestErrorHandlingNormal:
             )
         assert exc_info.value.status_code == 400
 
-    def test_err_005_error_contains_response_body(self, invalid_api_key: str) -> None:
+    def test_err_005_error_contains_response_body(
+        self, forbidden_exc: JQuantsForbiddenError
+    ) -> None:
         """ERR-005: Error exception contains response_body attribute."""
-        client = ClientV2(api_key=invalid_api_key)
-        with pytest.raises(JQuantsForbiddenError) as exc_info:
-            client._request("GET", "/equities/master")
-        assert exc_info.value.response_body is not None
+        assert forbidden_exc.response_body is not None
 
-    def test_err_006_exception_inheritance(self, invalid_api_key: str) -> None:
+    def test_err_006_exception_inheritance(
+        self, forbidden_exc: JQuantsForbiddenError
+    ) -> None:
         """ERR-006: JQuantsForbiddenError is caught by JQuantsAPIError."""
-        client = ClientV2(api_key=invalid_api_key)
-
         # Can catch with base exception
-        with pytest.raises(JQuantsAPIError):
-            client._request("GET", "/equities/master")
+        assert isinstance(forbidden_exc, JQuantsAPIError)
 
-    def test_err_007_json_error_message_extraction(self, invalid_api_key: str) -> None:
+    def test_err_007_json_error_message_extraction(
+        self, forbidden_exc: JQuantsForbiddenError
+    ) -> None:
         """ERR-007: Error message is extracted from JSON response."""
-        client = ClientV2(api_key=invalid_api_key)
-        with pytest.raises(JQuantsForbiddenError) as exc_info:
-            client._request("GET", "/equities/master")
-        message = str(exc_info.value)
+        message = str(forbidden_exc)
         assert message  # Not empty
         assert len(message) > 5
 
@@ -84,12 +102,26 @@ class TestErrorHandlingNormal:
 class TestErrorHandlingRare:
     """Rare/edge case error handling tests."""
 
-    def test_err_008_non_json_error_response(self) -> None:
-        """ERR-008: Non-JSON error response doesn't crash.
+    @pytest.mark.skip(reason="Rare response shape from J-Quants API - unit tested")
+    @pytest.mark.parametrize(
+        "case",
+        [
+            pytest.param("non_json", id="ERR-008_non_json_error_response"),
+            pytest.param("large_message", id="ERR-010_large_message_truncation"),
+            pytest.param("dict_message", id="ERR-011_dict_message_serialization"),
+            pytest.param("empty_body", id="ERR-012_empty_response_body"),
+        ],
+    )
+    def test_err_rare_responses(self, case: str) -> None:
+        """ERR-008/010/011/012: Rare error response shapes.
+
+        - ERR-008: Non-JSON error response doesn't crash.
+        - ERR-010: Large message field is truncated.
+        - ERR-011: Non-string message (dict/list) is serialized.
+        - ERR-012: Empty response body falls back to status code.
 
         Note: Hard to trigger with real API - covered in unit tests.
         """
-        pytest.skip("Non-JSON response is rare from J-Quants API - unit tested")
 
     def test_err_009_large_response_truncation(self) -> None:
         """ERR-009: Large error response is truncated to 2048 chars.
@@ -99,30 +131,9 @@ class TestErrorHandlingRare:
         assert ClientV2.RESPONSE_BODY_MAX_LENGTH == 2048
         pytest.skip("Large error response is rare from J-Quants API - unit tested")
 
-    def test_err_010_large_message_truncation(self) -> None:
-        """ERR-010: Large message field is truncated.
-
-        Note: Hard to trigger with real API - covered in unit tests.
-        """
-        pytest.skip("Large message field is rare from J-Quants API - unit tested")
-
-    def test_err_011_dict_message_serialization(self) -> None:
-        """ERR-011: Non-string message (dict/list) is serialized.
-
-        Note: Hard to trigger with real API - covered in unit tests.
-        """
-        pytest.skip("Dict message is rare from J-Quants API - unit tested")
-
-    def test_err_012_empty_response_body(self) -> None:
-        """ERR-012: Empty response body falls back to status code.
-
-        Note: Hard to trigger with real API - covered in unit tests.
-        """
-        pytest.skip("Empty response is rare from J-Quants API - unit tested")
-
-    def test_err_013_multiple_errors_session_state(self, invalid_api_key: str) -> None:
+    def test_err_013_multiple_errors_session_state(self, bad_client: ClientV2) -> None:
         """ERR-013: Multiple errors don't corrupt session state."""
-        client = ClientV2(api_key=invalid_api_key)
+        client = bad_client
 
         # First error
         with pytest.raises(JQuantsForbiddenError):
@@ -9,7 +9,14 @@ import pytest
 
 from jquants import constants_v2 as constants
 
-from .conftest import requires_api_key
+from .conftest import assert_sorted_by, requires_api_key
+
+# Expected date values, parsed once at import
+T_20241101 = pd.Timestamp("2024-11-01")
+T_20241103 = pd.Timestamp("2024-11-03")
+
+# Opt-in on-disk replay (JQUANTS_TEST_RESPONSE_CACHE), see conftest.response_cache
+pytestmark = pytest.mark.usefixtures("response_cache")
 
 
 @pytest.mark.integration
@@ -32,25 +39,7 @@ class TestFinsSummaryIntegration:
                     assert pd.api.types.is_datetime64_any_dtype(df[col])
 
             # Check sorted by DiscDate, DiscTime, Code
-            if len(df) > 1:
-                is_sorted = True
-                for i in range(len(df) - 1):
-                    curr = (
-                        df.iloc[i]["DiscDate"],
-                        df.iloc[i]["DiscTime"],
-                        df.iloc[i]["Code"],
-                    )
-                    next_ = (
-                        df.iloc[i + 1]["DiscDate"],
-                        df.iloc[i + 1]["DiscTime"],
-                        df.iloc[i + 1]["Code"],
-                    )
-                    if curr > next_:
-                        is_sorted = False
-                        break
-                assert (
-                    is_sorted
-                ), "DataFrame should be sorted by DiscDate, DiscTime, Code"
+            assert_sorted_by(df, ["DiscDate", "DiscTime", "Code"])
 
     @requires_api_key
     def test_get_fins_summary_with_date(self, client):
@@ -63,7 +52,7 @@ class TestFinsSummaryIntegration:
             assert list(df.columns) == constants.FINS_SUMMARY_COLUMNS
 
             # Check DiscDate is the specified date
-            assert all(df["DiscDate"] == pd.Timestamp("2024-11-01"))
+            assert (df["DiscDate"] == T_20241101).all()
 
     @requires_api_key
     def test_get_fins_summary_with_code_and_date(self, client):
@@ -112,53 +101,61 @@ class TestFinsSummaryIntegration:
                     assert pd.api.types.is_datetime64_any_dtype(df[col])
 
 
+@pytest.fixture(scope="module")
+def summary_range_nov(client) -> pd.DataFrame:
+    """Fetch get_summary_range("2024-11-01", "2024-11-03") once per module.
+
+    The multi-day range tests below only need views of this window, so they
+    share one fetch instead of requesting overlapping ranges. The single-day
+    test calls the API itself to cover the start_dt == end_dt path. Treat as
+    read-only.
+    """
+    return client.get_summary_range("2024-11-01", "2024-11-03")
+
+
 @pytest.mark.integration
 class TestSummaryRangeIntegration:
     """Integration tests for get_summary_range method."""
 
     @requires_api_key
-    def test_get_summary_range_single_day(self, client):
-        """Test get_summary_range for a single day."""
-        df = client.get_summary_range("2024-11-01", "2024-11-01")
+    def test_get_summary_range_single_day(self, cached_call):
+        """Test get_summary_range for a single day (start_dt == end_dt fast path)."""
+        df = cached_call(
+            "get_summary_range", start_dt="2024-11-01", end_dt="2024-11-01"
+        )
 
         assert isinstance(df, pd.DataFrame)
         assert list(df.columns) == constants.FINS_SUMMARY_COLUMNS
+        if not df.empty:
+            assert (df["DiscDate"] == T_20241101).all()
 
     @requires_api_key
-    def test_get_summary_range_multiple_days(self, client):
+    def test_get_summary_range_multiple_days(self, summary_range_nov):
         """Test get_summary_range for multiple days."""
-        df = client.get_summary_range("2024-11-01", "2024-11-03")
+        df = summary_range_nov
 
         assert isinstance(df, pd.DataFrame)
         assert list(df.columns) == constants.FINS_SUMMARY_COLUMNS
         if not df.empty:
+            # Check DiscDate stays within the requested range
+            assert df["DiscDate"].min() >= T_20241101
+            assert df["DiscDate"].max() <= T_20241103
+
             # Check sorted by DiscDate, DiscTime, Code
-            if len(df) > 1:
-                for i in range(len(df) - 1):
-                    curr = (
-                        df.iloc[i]["DiscDate"],
-                        df.iloc[i]["DiscTime"],
-                        df.iloc[i]["Code"],
-                    )
-                    next_ = (
-                        df.iloc[i + 1]["DiscDate"],
-                        df.iloc[i + 1]["DiscTime"],
-                        df.iloc[i + 1]["Code"],
-                    )
-                    assert curr <= next_, "Should be sorted by DiscDate, DiscTime, Code"
+            assert_sorted_by(df, ["DiscDate", "DiscTime", "Code"])
 
     @requires_api_key
-    def test_get_summary_range_column_completeness(self, client):
+    def test_get_summary_range_column_completeness(self, summary_range_nov):
         """Test that combined result has all expected columns."""
-        df = client.get_summary_range("2024-11-01", "2024-11-02")
+        df = summary_range_nov
 
         assert isinstance(df, pd.DataFrame)
         assert list(df.columns) == constants.FINS_SUMMARY_COLUMNS
 
     @requires_api_key
-    def test_get_summary_range_date_types(self, client):
+    def test_get_summary_range_date_types(self, summary_range_nov):
         """Test that date columns are datetime in combined result."""
-        df = client.get_summary_range("2024-11-01", "2024-11-02")
+        df = summary_range_nov
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
@@ -12,7 +12,10 @@ import pytest
 from jquants import constants_v2 as constants
 from jquants.exceptions import JQuantsAPIError
 
-from .conftest import requires_api_key
+from .conftest import assert_sorted_by, requires_api_key
+
+# Opt-in on-disk replay (JQUANTS_TEST_RESPONSE_CACHE), see conftest.response_cache
+pytestmark = pytest.mark.usefixtures("response_cache")
 
 
 def _recent_date_range(days_back: int = 30) -> tuple[str, str]:
@@ -35,19 +38,29 @@ def _recent_single_date(days_back: int = 14) -> str:
     return (date.today() - timedelta(days=days_back)).isoformat()
 
 
+@pytest.fixture(scope="class")
+def indices_0000_recent(client) -> pd.DataFrame:
+    """Fetch get_indices(code="0000") over the recent range once per class.
+
+    Shared by read-only assertions that would otherwise repeat the same
+    request. Treat as read-only.
+    """
+    from_date, to_date = _recent_date_range()
+    return client.get_indices(
+        code="0000",
+        from_date=from_date,
+        to_date=to_date,
+    )
+
+
 @pytest.mark.integration
 class TestIndicesIntegration:
     """Integration tests for Indices endpoints."""
 
     @requires_api_key
-    def test_get_indices(self, client):
+    def test_get_indices(self, indices_0000_recent):
         """Test get_indices returns valid DataFrame."""
-        from_date, to_date = _recent_date_range()
-        df = client.get_indices(
-            code="0000",
-            from_date=from_date,
-            to_date=to_date,
-        )
+        df = indices_0000_recent
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
@@ -61,13 +74,7 @@ class TestIndicesIntegration:
             assert pd.api.types.is_datetime64_any_dtype(df["Date"])
 
             # Check sorted by Date, Code
-            if len(df) > 1:
-                for i in range(len(df) - 1):
-                    assert (
-                        df.iloc[i]["Date"] < df.iloc[i + 1]["Date"]
-                        or df.iloc[i]["Date"] == df.iloc[i + 1]["Date"]
-                        and df.iloc[i]["Code"] <= df.iloc[i + 1]["Code"]
-                    )
+            assert_sorted_by(df, ["Date", "Code"])
 
     @requires_api_key
     def test_get_indices_with_date(self, client):
@@ -78,25 +85,21 @@ class TestIndicesIntegration:
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
             # All rows should have same date
-            assert df["Date"].nunique() == 1
+            dates = df["Date"].to_numpy()
+            assert (dates == dates[0]).all()
 
             # Check Date is datetime
             assert pd.api.types.is_datetime64_any_dtype(df["Date"])
 
     @requires_api_key
-    def test_get_indices_with_code_filter(self, client):
+    def test_get_indices_with_code_filter(self, indices_0000_recent):
         """Test get_indices with code filter."""
-        from_date, to_date = _recent_date_range()
-        df = client.get_indices(
-            code="0000",
-            from_date=from_date,
-            to_date=to_date,
-        )
+        df = indices_0000_recent
 
         assert isinstance(df, pd.DataFrame)
         # Should filter by code
         if not df.empty:
-            assert all(df["Code"] == "0000")
+            assert (df["Code"] == "0000").all()
 
     @requires_api_key
     def test_get_indices_empty_result(self, client):
@@ -153,14 +156,9 @@ class TestIndicesIntegration:
         # Note: This test may take longer due to full data retrieval
 
     @requires_api_key
-    def test_column_order_matches_constants(self, client):
+    def test_column_order_matches_constants(self, indices_0000_recent):
         """Test that returned DataFrame columns match constants definition order."""
-        from_date, to_date = _recent_date_range()
-        df = client.get_indices(
-            code="0000",
-            from_date=from_date,
-            to_date=to_date,
-        )
+        df = indices_0000_recent
 
         assert isinstance(df, pd.DataFrame)
         # If data exists, verify column order matches constants
@@ -9,7 +9,27 @@ import pytest
 
 from jquants import constants_v2 as constants
 
-from .conftest import requires_api_key, requires_premium
+from .conftest import assert_sorted_by, requires_api_key, requires_premium
+
+# Expected date values, parsed once at import
+T_20240101 = pd.Timestamp("2024-01-01")
+T_20240131 = pd.Timestamp("2024-01-31")
+
+# Opt-in on-disk replay (JQUANTS_TEST_RESPONSE_CACHE), see conftest.response_cache
+pytestmark = pytest.mark.usefixtures("response_cache")
+
+
+@pytest.fixture(scope="class")
+def trading_calendar_jan(client) -> pd.DataFrame:
+    """Fetch the 2024-01 trading calendar once per class.
+
+    Shared by read-only assertions that would otherwise repeat the same
+    request. Treat as read-only.
+    """
+    return client.get_markets_trading_calendar(
+        from_date="2024-01-01",
+        to_date="2024-01-31",
+    )
 
 
 @pytest.mark.integration
@@ -17,12 +37,9 @@ class TestMarketsIntegration:
     """Integration tests for Markets endpoints."""
 
     @requires_api_key
-    def test_get_markets_trading_calendar(self, client):
+    def test_get_markets_trading_calendar(self, trading_calendar_jan):
         """Test get_markets_trading_calendar returns valid DataFrame."""
-        df = client.get_markets_trading_calendar(
-            from_date="2024-01-01",
-            to_date="2024-01-31",
-        )
+        df = trading_calendar_jan
 
         assert isinstance(df, pd.DataFrame)
         if not df.empty:
@@ -50,7 +67,7 @@ class TestMarketsIntegration:
         assert isinstance(df, pd.DataFrame)
         # Should filter by holiday division
         if not df.empty:
-            assert all(df["HolDiv"] == "1")
+            assert (df["HolDiv"] == "1").all()
 
     @requires_api_key
     def test_get_markets_weekly_margin_interest(self, client):
@@ -67,13 +84,7 @@ class TestMarketsIntegration:
             assert pd.api.types.is_datetime64_any_dtype(df["Date"])
 
             # Check sorted by Date, Code
-            if len(df) > 1:
-                for i in range(len(df) - 1):
-                    assert (
-                        df.iloc[i]["Date"] < df.iloc[i + 1]["Date"]
-                        or df.iloc[i]["Date"] == df.iloc[i + 1]["Date"]
-                        and df.iloc[i]["Code"] <= df.iloc[i + 1]["Code"]
-                    )
+            assert_sorted_by(df, ["Date", "Code"])
 
     @requires_api_key
     def test_get_markets_short_selling(self, client):
@@ -108,7 +119,7 @@ class TestMarketsIntegration:
         assert isinstance(df, pd.DataFrame)
         # Should filter by sector
         if not df.empty:
-            assert all(df["S33"] == "0050")
+            assert (df["S33"] == "0050").all()
 
     @requires_api_key
     @pytest.mark.premium
@@ -154,8 +165,8 @@ class TestMarketsIntegration:
 
             # Verify DiscDate is within specified range (filter validation)
             if "DiscDate" in df.columns:
-                min_date = pd.Timestamp("2024-01-01")
-                max_date = pd.Timestamp("2024-01-31")
+                min_date = T_20240101
+                max_date = T_20240131
                 assert df["DiscDate"].min() >= min_date, "DiscDate below range"
                 assert df["DiscDate"].max() <= max_date, "DiscDate above range"
 
@@ -193,16 +204,12 @@ class TestMarketsIntegration:
         assert isinstance(df, pd.DataFrame)
         # Should filter by code
         if not df.empty:
-            assert all(df["Code"] == "72030")
+            assert (df["Code"] == "72030").all()
 
     @requires_api_key
-    def test_column_order_matches_constants(self, client):
+    def test_column_order_matches_constants(self, trading_calendar_jan):
         """Test that returned DataFrame columns match constants definition order."""
-        # Use a known date range with data
-        df = client.get_markets_trading_calendar(
-            from_date="2024-01-01",
-            to_date="2024-01-31",
-        )
+        df = trading_calendar_jan
 
         assert isinstance(df, pd.DataFrame)
         # If data exists, verify column order matches constants
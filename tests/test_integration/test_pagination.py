@@ -15,17 +15,21 @@ pytestmark = pytest.mark.integration
 class TestPaginationNormal:
     """Normal pagination test cases."""
 
-    def test_page_001_single_page_response(self, client: ClientV2) -> None:
+    def test_page_001_single_page_response(
+        self, equities_master_raw: list[dict]
+    ) -> None:
         """PAGE-001: Single page response returns data list."""
         # equities/master returns all data in one page for most cases
-        data = client._paginated_get("/equities/master")
+        data = equities_master_raw
         assert isinstance(data, list)
         assert len(data) > 0
         # Each item should be a dict with stock info
         assert isinstance(data[0], dict)
         assert "Code" in data[0] or "Date" in data[0]
 
-    def test_page_002_multi_page_combined(self, client: ClientV2) -> None:
+    def test_page_002_multi_page_combined(
+        self, equities_master_raw: list[dict]
+    ) -> None:
         """PAGE-002: Multiple pages are automatically combined.
 
         Note: This test may take longer as it fetches paginated data.
@@ -33,15 +37,17 @@ class TestPaginationNormal:
         """
         # Use a date range that's likely to have multiple pages
         # If this endpoint doesn't paginate, the test still passes
-        data = client._paginated_get("/equities/master")
+        data = equities_master_raw
         assert isinstance(data, list)
         # Should have significant amount of data
         assert len(data) > 100  # At minimum, there are many listed stocks
 
-    def test_page_003_no_pagination_key_terminates(self, client: ClientV2) -> None:
+    def test_page_003_no_pagination_key_terminates(
+        self, equities_master_raw: list[dict]
+    ) -> None:
         """PAGE-003: Response without pagination_key terminates correctly."""
         # equities/master typically returns all data without pagination
-        data = client._paginated_get("/equities/master")
+        data = equities_master_raw
         assert isinstance(data, list)
         # No error means termination was successful
 
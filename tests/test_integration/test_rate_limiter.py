@@ -1,59 +1,88 @@
 """Sub-Phase 3.1.5 Integration tests: Rate Limiter (RATE-001~008)."""
 
-import threading
 import time
-from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from unittest.mock import call, patch
 
+import numpy as np
 import pytest
 
 from jquants.exceptions import JQuantsRateLimitError
 
 
-class TestRateLimiterDefaultBehavior:
-    """Test rate limiter default behavior (RATE-001, RATE-006)."""
+class _FakeResponse:
+    """requests.Response の軽量な代替（_request が参照する属性のみ）"""
 
-    def test_rate_limit_none_uses_free_plan_default(self):
-        """RATE-001: rate_limit=None時の挙動"""
-        from jquants import ClientV2
+    __slots__ = ("ok", "status_code", "text", "headers", "_json", "close_calls")
 
-        client = ClientV2(api_key="test_api_key", rate_limit=None)
+    def __init__(
+        self,
+        ok: bool,
+        status_code: int,
+        text: str = "",
+        json_data: dict | None = None,
+        headers: dict | None = None,
+    ) -> None:
+        self.ok = ok
+        self.status_code = status_code
+        self.text = text
+        self._json = json_data if json_data is not None else {}
+        self.headers = headers if headers is not None else {}
+        self.close_calls = 0
 
-        # Freeプラン（5 req/min）がデフォルト
-        assert client._rate_limit == 5
-        # 間隔は12秒（60/5）
-        assert client._pacer.interval == pytest.approx(12.0, rel=1e-6)
+    def json(self) -> dict:
+        return self._json
 
-    def test_max_workers_1_is_serial(self):
-        """RATE-006: max_workers=1で直列取得"""
-        from jquants import ClientV2
+    def close(self) -> None:
+        self.close_calls += 1
 
-        client = ClientV2(api_key="test_api_key", max_workers=1)
 
-        assert client._max_workers == 1
+class _FakeSession:
+    """requests.Session の代替: request() ごとに登録順でレスポンスを返す"""
 
+    def __init__(self, *responses: _FakeResponse) -> None:
+        self._responses = iter(responses)
+        self.request_calls = 0
 
-class TestRateLimiterCustomRate:
-    """Test rate limiter with custom rate (RATE-002)."""
+    def request(self, method: str, url: str, **kwargs) -> _FakeResponse:
+        self.request_calls += 1
+        return next(self._responses)
 
-    def test_rate_limit_60_custom_value(self):
-        """RATE-002: rate_limit=60等カスタム値"""
-        from jquants import ClientV2
 
-        client = ClientV2(api_key="test_api_key", rate_limit=60)
+class TestRateLimiterDefaultBehavior:
+    """Test rate limiter default behavior (RATE-006)."""
 
-        assert client._rate_limit == 60
-        # 間隔は1秒（60/60）
-        assert client._pacer.interval == pytest.approx(1.0, rel=1e-6)
+    def test_max_workers_1_is_serial(self, client_factory):
+        """RATE-006: max_workers=1で直列取得"""
+        client = client_factory(max_workers=1)
 
-    def test_rate_limit_120_custom_value(self):
-        """RATE-002: rate_limit=120等カスタム値"""
-        from jquants import ClientV2
+        assert client._max_workers == 1
 
-        client = ClientV2(api_key="test_api_key", rate_limit=120)
 
-        assert client._rate_limit == 120
-        # 間隔は0.5秒（60/120）
-        assert client._pacer.interval == pytest.approx(0.5, rel=1e-6)
+class TestRateLimiterCustomRate:
+    """Test rate limiter default and custom rate (RATE-001, RATE-002)."""
+
+    @pytest.mark.parametrize(
+        ("rate_limit", "expected_rate", "expected_interval"),
+        [
+            # Freeプラン（5 req/min）がデフォルト、間隔は12秒（60/5）
+            pytest.param(None, 5, 12.0, id="RATE-001_none_free_plan_default"),
+            # 間隔は1秒（60/60）
+            pytest.param(60, 60, 1.0, id="RATE-002_60"),
+            # 間隔は0.6秒（60/100）
+            pytest.param(100, 100, 0.6, id="RATE-002_100"),
+            # 間隔は0.5秒（60/120）
+            pytest.param(120, 120, 0.5, id="RATE-002_120"),
+        ],
+    )
+    def test_rate_limit_sets_pacer_interval(
+        self, client_factory, rate_limit, expected_rate, expected_interval
+    ):
+        """RATE-001/002: rate_limit=None時の挙動、rate_limit=60等カスタム値"""
+        client = client_factory(rate_limit=rate_limit)
+
+        assert client._rate_limit == expected_rate
+        assert client._pacer.interval == pytest.approx(expected_interval, rel=1e-6)
 
 
 @pytest.mark.slow
@@ -67,21 +96,20 @@ class TestRateLimiterPacing:
         client = ClientV2(api_key="test_api_key", rate_limit=120)  # 0.5秒間隔
 
         # Pacerの動作を直接テスト
-        start = time.monotonic()
+        start_ns = time.monotonic_ns()
         client._pacer.wait()  # 初回：即時
         client._pacer.wait()  # 2回目：0.5秒待機
         client._pacer.wait()  # 3回目：0.5秒待機
-        elapsed = time.monotonic() - start
+        elapsed_ns = time.monotonic_ns() - start_ns
 
         # 最低約1.0秒経過すべき
-        assert elapsed >= 0.9
+        assert elapsed_ns >= 900_000_000
 
-    def test_pacer_integrated_with_client(self):
+    def test_pacer_integrated_with_client(self, client_factory):
         """RATE-003: ClientV2にPacerが統合されている"""
-        from jquants import ClientV2
         from jquants.pacer import Pacer
 
-        client = ClientV2(api_key="test_api_key", rate_limit=60)
+        client = client_factory(rate_limit=60)
 
         # Pacerインスタンスが存在
         assert hasattr(client, "_pacer")
@@ -91,12 +119,9 @@ class TestRateLimiterPacing:
 class TestRateLimiter429Retry:
     """Test 429 retry behavior (RATE-004, RATE-005)."""
 
-    def test_429_waits_before_retry(self):
+    def test_429_waits_before_retry(self, client_factory):
         """RATE-004: 429で5分10秒待ってリトライ"""
-        from jquants import ClientV2
-
-        client = ClientV2(
-            api_key="test_api_key",
+        client = client_factory(
             retry_on_429=True,
             retry_wait_seconds=310,
             retry_max_attempts=3,
@@ -107,24 +132,18 @@ class TestRateLimiter429Retry:
         assert client._retry_wait_seconds == 310
         assert client._retry_max_attempts == 3
 
-    def test_429_immediate_exception_when_disabled(self):
+    def test_429_immediate_exception_when_disabled(self, client_factory):
         """RATE-005: retry_on_429=Falseで即例外"""
-        from jquants import ClientV2
-
-        client = ClientV2(
-            api_key="test_api_key",
+        client = client_factory(
             retry_on_429=False,
         )
 
         # retry_on_429=False が設定されている
         assert client._retry_on_429 is False
 
-    def test_429_retry_mechanism_with_mock(self):
+    def test_429_retry_mechanism_with_mock(self, client_factory):
         """RATE-004: 429リトライメカニズム（モック）"""
-        from jquants import ClientV2
-
-        client = ClientV2(
-            api_key="test_api_key",
+        client = client_factory(
             retry_on_429=True,
             retry_wait_seconds=1,  # テスト用に短縮
             retry_max_attempts=2,
@@ -140,11 +159,9 @@ class TestRateLimiter429Retry:
 class TestRateLimiterParallel:
     """Test parallel execution (RATE-007, RATE-008)."""
 
-    def test_max_workers_greater_than_1_enables_parallel(self):
+    def test_max_workers_greater_than_1_enables_parallel(self, client_factory):
         """RATE-007: max_workers>1で並列取得"""
-        from jquants import ClientV2
-
-        client = ClientV2(api_key="test_api_key", max_workers=5)
+        client = client_factory(max_workers=5)
 
         assert client._max_workers == 5
 
@@ -154,55 +171,42 @@ class TestRateLimiterParallel:
 
         client = ClientV2(api_key="test_api_key", rate_limit=60)  # 1秒間隔
 
-        timestamps: list[float] = []
-        lock = threading.Lock()
-
-        def worker():
+        def worker() -> int:
             client._pacer.wait()
-            with lock:
-                timestamps.append(time.monotonic())
-
-        threads = [threading.Thread(target=worker) for _ in range(3)]
+            return time.monotonic_ns()
 
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
-        # タイムスタンプを時系列順にソート
-        timestamps.sort()
+        # ClientV2._fetch_date_range と同じくThreadPoolExecutorで並列実行
+        # （ワーカー内の例外もresult()で再送出される）
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(worker) for _ in range(3)]
+            # タイムスタンプを時系列順にソート
+            timestamps = sorted(f.result() for f in as_completed(futures))
 
         # 各リクエスト間の間隔が約1秒であることを確認
-        for i in range(1, len(timestamps)):
-            diff = timestamps[i] - timestamps[i - 1]
-            # 間隔は最低でも0.9秒（少しの誤差を許容）
-            assert diff >= 0.9, f"Interval {i}: {diff} < 0.9"
+        diffs_ns = np.diff(timestamps)
+        # 間隔は最低でも0.9秒（少しの誤差を許容）
+        assert (diffs_ns >= 900_000_000).all(), f"Intervals (ns): {diffs_ns} < 0.9 s"
 
 
 class TestRateLimiter429Integration:
     """Test 429 handling integration."""
 
-    def test_429_response_raises_rate_limit_error(self):
-        """429レスポンスでJQuantsRateLimitErrorが発生"""
+    def test_429_response_raises_rate_limit_error(self, fake_jquants_server):
+        """429レスポンスでJQuantsRateLimitErrorが発生（ローカルHTTPサーバ経由）"""
         from jquants import ClientV2
 
         # retry_on_429=False で即座に例外を発生させる
         client = ClientV2(api_key="test_api_key", retry_on_429=False)
+        # 実際の requests/urllib3 経路をローカルの 429 サーバに向ける
+        client.JQUANTS_API_BASE = fake_jquants_server
+        # HTTP(S)_PROXY が設定された環境でもローカルサーバに直接接続する
+        client._request_session().trust_env = False
 
-        with patch.object(client, "_request_session") as mock_session_method:
-            mock_session = MagicMock()
-            mock_response = MagicMock()
-            mock_response.ok = False
-            mock_response.status_code = 429
-            mock_response.text = '{"message": "Rate limit exceeded"}'
-            mock_response.json.return_value = {"message": "Rate limit exceeded"}
-            mock_session.request.return_value = mock_response
-            mock_session_method.return_value = mock_session
-
-            with pytest.raises(JQuantsRateLimitError) as exc_info:
-                client._request("GET", "/path")
+        with pytest.raises(JQuantsRateLimitError) as exc_info:
+            client._request("GET", "/path")
 
-            assert exc_info.value.status_code == 429
+        assert exc_info.value.status_code == 429
+        assert "Rate limit exceeded" in str(exc_info.value)
 
     @pytest.mark.slow
     def test_pacer_works_between_requests(self):
@@ -222,12 +226,9 @@ class TestRateLimiter429Integration:
 class TestRateLimiterAllParametersCombined:
     """Test all rate limiter parameters combined."""
 
-    def test_all_parameters_set_correctly(self):
+    def test_all_parameters_set_correctly(self, client_factory):
         """全パラメータが正しく設定される"""
-        from jquants import ClientV2
-
-        client = ClientV2(
-            api_key="test_api_key",
+        client = client_factory(
             rate_limit=100,
             max_workers=3,
             retry_on_429=True,
@@ -242,12 +243,10 @@ class TestRateLimiterAllParametersCombined:
         assert client._retry_max_attempts == 5
         assert client._pacer.interval == pytest.approx(0.6, rel=1e-6)
 
-    def test_default_parameters_are_safe(self):
+    def test_default_parameters_are_safe(self, client_factory):
         """デフォルトパラメータが最安全である"""
-        from jquants import ClientV2
-
         # 明示的なパラメータなしで初期化
-        client = ClientV2(api_key="test_api_key")
+        client = client_factory()
 
         # Freeプランのレート（5 req/min）
         assert client._rate_limit == 5
@@ -270,19 +269,14 @@ class TestRequestPathIntegration:
 
         client = ClientV2(api_key="test_api_key", rate_limit=120)
 
-        with patch.object(client, "_request_session") as mock_session_method:
-            mock_session = MagicMock()
-            mock_response = MagicMock()
-            mock_response.ok = True
-            mock_response.status_code = 200
-            mock_session.request.return_value = mock_response
-            mock_session_method.return_value = mock_session
+        mock_response = _FakeResponse(ok=True, status_code=200)
+        client._session = _FakeSession(mock_response)
 
-            with patch.object(client._pacer, "wait", return_value=0.0) as mock_wait:
-                client._request("GET", "/test")
+        with patch.object(client._pacer, "wait", return_value=0.0) as mock_wait:
+            client._request("GET", "/test")
 
-                # 成功時はwait()が1回呼ばれる（リトライなし）
-                mock_wait.assert_called_once()
+            # 成功時はwait()が1回呼ばれる（リトライなし）
+            mock_wait.assert_called_once()
 
     def test_429_retry_then_success(self):
         """429 → wait → 再試行 → 成功"""
@@ -295,38 +289,33 @@ class TestRequestPathIntegration:
             retry_max_attempts=3,
         )
 
-        with patch.object(client, "_request_session") as mock_session_method:
-            mock_session = MagicMock()
-
-            # 1回目: 429, 2回目: 200
-            mock_response_429 = MagicMock()
-            mock_response_429.ok = False
-            mock_response_429.status_code = 429
-            mock_response_429.text = '{"message": "Rate limit exceeded"}'
-            mock_response_429.json.return_value = {"message": "Rate limit exceeded"}
-            mock_response_429.headers = {}  # No Retry-After header
-
-            mock_response_200 = MagicMock()
-            mock_response_200.ok = True
-            mock_response_200.status_code = 200
-
-            mock_session.request.side_effect = [mock_response_429, mock_response_200]
-            mock_session_method.return_value = mock_session
-
-            with patch.object(client._pacer, "wait", return_value=0.0) as mock_wait:
-                with patch("time.sleep") as mock_sleep:
-                    response = client._request("GET", "/test")
-
-                    # 成功レスポンスが返る
-                    assert response.status_code == 200
-                    # time.sleepが1回呼ばれる（リトライ待機）
-                    mock_sleep.assert_called_once_with(0.01)
-                    # sessionが2回呼ばれる（初回 + リトライ）
-                    assert mock_session.request.call_count == 2
-                    # wait()が2回呼ばれる（各試行前にpacing適用）
-                    assert mock_wait.call_count == 2
-                    # 429レスポンスがcloseされる（接続プール解放）
-                    mock_response_429.close.assert_called_once()
+        # 1回目: 429, 2回目: 200
+        mock_response_429 = _FakeResponse(
+            ok=False,
+            status_code=429,
+            text='{"message": "Rate limit exceeded"}',
+            json_data={"message": "Rate limit exceeded"},
+            headers={},  # No Retry-After header
+        )
+
+        mock_response_200 = _FakeResponse(ok=True, status_code=200)
+
+        client._session = session = _FakeSession(mock_response_429, mock_response_200)
+
+        with patch.object(client._pacer, "wait", return_value=0.0) as mock_wait:
+            with patch("time.sleep") as mock_sleep:
+                response = client._request("GET", "/test")
+
+                # 成功レスポンスが返る
+                assert response.status_code == 200
+                # time.sleepが1回呼ばれる（リトライ待機）
+                mock_sleep.assert_called_once_with(0.01)
+                # sessionが2回呼ばれる（初回 + リトライ）
+                assert session.request_calls == 2
+                # wait()が2回呼ばれる（各試行前にpacing適用）
+                assert mock_wait.call_count == 2
+                # 429レスポンスがcloseされる（接続プール解放）
+                assert mock_response_429.close_calls == 1
 
     def test_429_retry_uses_retry_after_header(self):
         """429 + Retry-After ヘッダ → ヘッダ値で待機"""
@@ -339,34 +328,29 @@ class TestRequestPathIntegration:
             retry_max_attempts=3,
         )
 
-        with patch.object(client, "_request_session") as mock_session_method:
-            mock_session = MagicMock()
-
-            # 1回目: 429 with Retry-After, 2回目: 200
-            mock_response_429 = MagicMock()
-            mock_response_429.ok = False
-            mock_response_429.status_code = 429
-            mock_response_429.text = '{"message": "Rate limit exceeded"}'
-            mock_response_429.json.return_value = {"message": "Rate limit exceeded"}
-            mock_response_429.headers = {"Retry-After": "5"}  # 5秒待機指示
+        # 1回目: 429 with Retry-After, 2回目: 200
+        mock_response_429 = _FakeResponse(
+            ok=False,
+            status_code=429,
+            text='{"message": "Rate limit exceeded"}',
+            json_data={"message": "Rate limit exceeded"},
+            headers={"Retry-After": "5"},  # 5秒待機指示
+        )
 
-            mock_response_200 = MagicMock()
-            mock_response_200.ok = True
-            mock_response_200.status_code = 200
+        mock_response_200 = _FakeResponse(ok=True, status_code=200)
 
-            mock_session.request.side_effect = [mock_response_429, mock_response_200]
-            mock_session_method.return_value = mock_session
+        client._session = _FakeSession(mock_response_429, mock_response_200)
 
-            with patch.object(client._pacer, "wait", return_value=0.0):
-                with patch("time.sleep") as mock_sleep:
-                    response = client._request("GET", "/test")
+        with patch.object(client._pacer, "wait", return_value=0.0):
+            with patch("time.sleep") as mock_sleep:
+                response = client._request("GET", "/test")
 
-                    # 成功レスポンスが返る
-                    assert response.status_code == 200
-                    # Retry-Afterヘッダ値（5秒）で待機（デフォルト310秒ではない）
-                    mock_sleep.assert_called_once_with(5)
-                    # 429レスポンスがcloseされる
-                    mock_response_429.close.assert_called_once()
+                # 成功レスポンスが返る
+                assert response.status_code == 200
+                # Retry-Afterヘッダ値（5秒）で待機（デフォルト310秒ではない）
+                mock_sleep.assert_called_once_with(5)
+                # 429レスポンスがcloseされる
+                assert mock_response_429.close_calls == 1
 
     def test_429_retry_disabled_raises_immediately(self):
         """429 + retry_on_429=False → 即例外"""
@@ -377,27 +361,25 @@ class TestRequestPathIntegration:
             retry_on_429=False,
         )
 
-        with patch.object(client, "_request_session") as mock_session_method:
-            mock_session = MagicMock()
-            mock_response = MagicMock()
-            mock_response.ok = False
-            mock_response.status_code = 429
-            mock_response.text = '{"message": "Rate limit exceeded"}'
-            mock_response.json.return_value = {"message": "Rate limit exceeded"}
-            mock_response.headers = {}  # No Retry-After header
-            mock_session.request.return_value = mock_response
-            mock_session_method.return_value = mock_session
-
-            with patch.object(client._pacer, "wait", return_value=0.0):
-                with patch("time.sleep") as mock_sleep:
-                    with pytest.raises(JQuantsRateLimitError) as exc_info:
-                        client._request("GET", "/test")
-
-                    assert exc_info.value.status_code == 429
-                    # time.sleepは呼ばれない（即例外）
-                    mock_sleep.assert_not_called()
-                    # sessionは1回のみ
-                    assert mock_session.request.call_count == 1
+        mock_response = _FakeResponse(
+            ok=False,
+            status_code=429,
+            text='{"message": "Rate limit exceeded"}',
+            json_data={"message": "Rate limit exceeded"},
+            headers={},  # No Retry-After header
+        )
+        client._session = session = _FakeSession(mock_response)
+
+        with patch.object(client._pacer, "wait", return_value=0.0):
+            with patch("time.sleep") as mock_sleep:
+                with pytest.raises(JQuantsRateLimitError) as exc_info:
+                    client._request("GET", "/test")
+
+                assert exc_info.value.status_code == 429
+                # time.sleepは呼ばれない（即例外）
+                mock_sleep.assert_not_called()
+                # sessionは1回のみ
+                assert session.request_calls == 1
 
     def test_429_retry_max_attempts_exceeded_raises(self):
         """429 + retry_max_attempts超過 → 例外"""
@@ -410,39 +392,35 @@ class TestRequestPathIntegration:
             retry_max_attempts=2,
         )
 
-        with patch.object(client, "_request_session") as mock_session_method:
-            mock_session = MagicMock()
-
-            # 各リクエストで異なるレスポンスを返す（close検証のため）
-            mock_responses = []
-            for _ in range(3):
-                resp = MagicMock()
-                resp.ok = False
-                resp.status_code = 429
-                resp.text = '{"message": "Rate limit exceeded"}'
-                resp.json.return_value = {"message": "Rate limit exceeded"}
-                resp.headers = {}  # No Retry-After header
-                mock_responses.append(resp)
-
-            mock_session.request.side_effect = mock_responses
-            mock_session_method.return_value = mock_session
-
-            with patch.object(client._pacer, "wait", return_value=0.0):
-                with patch("time.sleep") as mock_sleep:
-                    with pytest.raises(JQuantsRateLimitError) as exc_info:
-                        client._request("GET", "/test")
-
-                    assert exc_info.value.status_code == 429
-                    # time.sleepが2回呼ばれる（リトライ2回分）
-                    assert mock_sleep.call_count == 2
-                    # sessionが3回呼ばれる（初回 + リトライ2回）
-                    assert mock_session.request.call_count == 3
-                    # 全レスポンスがcloseされる（接続プール解放）
-                    mock_responses[0].close.assert_called_once()
-                    mock_responses[1].close.assert_called_once()
-                    mock_responses[
-                        2
-                    ].close.assert_called_once()  # 上限到達時も明示的にclose
+        # 各リクエストで異なるレスポンスを返す（close検証のため）
+        mock_responses = []
+        for _ in range(3):
+            resp = _FakeResponse(
+                ok=False,
+                status_code=429,
+                text='{"message": "Rate limit exceeded"}',
+                json_data={"message": "Rate limit exceeded"},
+                headers={},  # No Retry-After header
+            )
+            mock_responses.append(resp)
+
+        client._session = session = _FakeSession(*mock_responses)
+
+        with patch.object(client._pacer, "wait", return_value=0.0):
+            with patch("time.sleep") as mock_sleep:
+                with pytest.raises(JQuantsRateLimitError) as exc_info:
+                    client._request("GET", "/test")
+
+                assert exc_info.value.status_code == 429
+                # time.sleepが2回呼ばれる（リトライ2回分、実時間の待機なし）
+                assert mock_sleep.call_args_list == [call(0.01), call(0.01)]
+                # sessionが3回呼ばれる（初回 + リトライ2回）
+                assert session.request_calls == 3
+                # 全レスポンスがcloseされる（接続プール解放）
+                assert mock_responses[0].close_calls == 1
+                assert mock_responses[1].close_calls == 1
+                # 上限到達時も明示的にclose
+                assert mock_responses[2].close_calls == 1
 
     def test_connection_pool_uses_max_workers(self):
         """接続プールに_max_workersが反映される"""
@@ -2,7 +2,7 @@
 
 import threading
 import time
-from unittest.mock import patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -66,6 +66,14 @@ class TestPacerValidation:
             Pacer(rate=-100)
         assert "rate" in str(exc_info.value).lower()
 
+    def test_burst_zero_raises_valueerror(self):
+        """PACER-003: burst=0 → ValueError"""
+        from jquants.pacer import Pacer
+
+        with pytest.raises(ValueError) as exc_info:
+            Pacer(rate=60, burst=0)
+        assert "burst" in str(exc_info.value).lower()
+
 
 class TestPacerFirstWait:
     """Test Pacer first wait behavior (PACER-004)."""
@@ -282,46 +290,118 @@ class TestPacerThreadSafety:
 
 
 class TestPacerMockedTime:
-    """Test Pacer with mocked time for precise control."""
+    """Test Pacer with an injected clock for precise control."""
 
     def test_wait_calculation_precise(self):
         """wait()の計算が正確"""
         from jquants.pacer import Pacer
 
-        with patch("time.monotonic") as mock_time:
-            with patch("time.sleep") as mock_sleep:
-                mock_time.return_value = 100.0
+        clock = Mock(return_value=100_000_000_000)
+        sleep = Mock()
 
-                pacer = Pacer(rate=60)  # 1秒間隔
+        pacer = Pacer(rate=60, clock=clock, sleep=sleep)  # 1秒間隔
 
-                # 初回
-                waited = pacer.wait()
-                assert waited == 0.0
-                mock_sleep.assert_not_called()
+        # 初回
+        waited = pacer.wait()
+        assert waited == 0.0
+        sleep.assert_not_called()
 
-                # 2回目（0.3秒経過）
-                mock_time.return_value = 100.3
-                waited = pacer.wait()
-                # 1.0 - 0.3 = 0.7秒待機
-                mock_sleep.assert_called_once()
-                assert mock_sleep.call_args[0][0] == pytest.approx(0.7, rel=1e-6)
+        # 2回目（0.3秒経過）
+        clock.return_value = 100_300_000_000
+        waited = pacer.wait()
+        # 1.0 - 0.3 = 0.7秒待機
+        sleep.assert_called_once()
+        assert sleep.call_args[0][0] == pytest.approx(0.7, rel=1e-6)
 
     def test_wait_no_sleep_when_elapsed_exceeds_interval(self):
         """間隔以上経過後は sleep しない"""
         from jquants.pacer import Pacer
 
-        with patch("time.monotonic") as mock_time:
-            with patch("time.sleep") as mock_sleep:
-                mock_time.return_value = 100.0
+        clock = Mock(return_value=100_000_000_000)
+        sleep = Mock()
 
-                pacer = Pacer(rate=60)  # 1秒間隔
+        pacer = Pacer(rate=60, clock=clock, sleep=sleep)  # 1秒間隔
 
-                # 初回
-                pacer.wait()
+        # 初回
+        pacer.wait()
+
+        # 2回目（2秒経過 - 間隔の2倍）
+        clock.return_value = 102_000_000_000
+        waited = pacer.wait()
+
+        assert waited == 0.0
+        sleep.assert_not_called()
+
+    def test_back_to_back_waits_reserve_consecutive_slots(self):
+        """同時刻の連続wait()は interval 間隔のスロットを順に予約する"""
+        from jquants.pacer import Pacer
+
+        clock = Mock(return_value=100_000_000_000)
+        sleep = Mock()
+
+        pacer = Pacer(rate=60, clock=clock, sleep=sleep)  # 1秒間隔
+
+        # 時刻が進まないまま3回呼ぶ（並列ワーカーが同時に到着した状況）
+        waits = [pacer.wait() for _ in range(3)]
+
+        assert waits == [0.0, pytest.approx(1.0), pytest.approx(2.0)]
+        assert [c.args[0] for c in sleep.call_args_list] == [
+            pytest.approx(1.0),
+            pytest.approx(2.0),
+        ]
+
+
+class TestPacerBurst:
+    """Test Pacer burst (token bucket) behavior with an injected clock."""
+
+    def test_burst_allows_immediate_requests_then_paces(self):
+        """burst=3: 最初の3件は即時、4件目以降は interval 間隔"""
+        from jquants.pacer import Pacer
+
+        clock = Mock(return_value=100_000_000_000)
+        sleep = Mock()
+
+        pacer = Pacer(rate=60, burst=3, clock=clock, sleep=sleep)  # 1秒間隔
+
+        waits = [pacer.wait() for _ in range(5)]
+
+        assert waits == [
+            0.0,
+            0.0,
+            0.0,
+            pytest.approx(1.0),
+            pytest.approx(2.0),
+        ]
+
+    def test_burst_refills_at_rate(self):
+        """burst 消費後は経過時間に応じてトークンが補充される"""
+        from jquants.pacer import Pacer
+
+        clock = Mock(return_value=100_000_000_000)
+        sleep = Mock()
+
+        pacer = Pacer(rate=60, burst=3, clock=clock, sleep=sleep)  # 1秒間隔
+        for _ in range(3):
+            pacer.wait()
+
+        # 1.5秒経過 → 1トークン補充済み
+        clock.return_value = 101_500_000_000
+        assert pacer.wait() == 0.0
+        # 次のトークンは 102.0 に補充される
+        assert pacer.wait() == pytest.approx(0.5)
+        assert sleep.call_args[0][0] == pytest.approx(0.5)
+
+    def test_burst_capacity_does_not_exceed_burst_after_idle(self):
+        """長時間アイドルでもバケットは burst 件までしか貯まらない"""
+        from jquants.pacer import Pacer
+
+        clock = Mock(return_value=100_000_000_000)
+        sleep = Mock()
+
+        pacer = Pacer(rate=60, burst=2, clock=clock, sleep=sleep)  # 1秒間隔
+        pacer.wait()
 
-                # 2回目（2秒経過 - 間隔の2倍）
-                mock_time.return_value = 102.0
-                waited = pacer.wait()
+        clock.return_value = 1_000_000_000_000
+        waits = [pacer.wait() for _ in range(3)]
 
-                assert waited == 0.0
-                mock_sleep.assert_not_called()
+        assert waits == [0.0, 0.0, pytest.approx(1.0)]